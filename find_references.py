@@ -4,76 +4,151 @@ Extended debug script to find where references actually start in this specific P
 """
 
 import sys
-import pdfplumber
 import re
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import pymupdf  # native text extraction, much faster than pdfplumber
+except ImportError:
+    pymupdf = None
+
+try:
+    import pypdfium2  # installed alongside pdfplumber >= 0.10
+except ImportError:
+    pypdfium2 = None
+
+# Bibliography section headers, and common academic citation line shapes
+# fused into one alternation, each scanned once over a page's text. Headers
+# get their own pattern: a greedy citation match would otherwise swallow a
+# header later on the same line. Whitespace classes exclude '\n' so no
+# pattern spans two lines.
+INDICATOR_RE = re.compile(r'References|REFERENCES|Bibliography|BIBLIOGRAPHY')
+CITATION_RE = re.compile(
+    r'[A-Z][a-z]+.*\(\d{4}\)|'       # Author (year)
+    r'[A-Z][a-z]+.*,[^\S\n]*\d{4}|'  # Author, year
+    r'^\d+\.[^\S\n]*[A-Z]|'          # 1. Author
+    r'^\[\d+\]',                     # [1]
+    re.MULTILINE
+)
+
+
+@contextmanager
+def open_pdf_pages(pdf_path: str):
+    """
+    Open a PDF and yield (total_pages, page_text), where page_text(idx) returns
+    the raw text of a single page.
+
+    Only raw lines are needed here, so native extractors that skip layout
+    analysis are preferred: PyMuPDF, then PDFium. pdfplumber (character-level
+    layout clustering) is the last resort.
+    """
+    if pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            yield len(doc), lambda idx: doc.load_page(idx).get_text("text")
+    elif pypdfium2 is not None:
+        doc = pypdfium2.PdfDocument(pdf_path)
+        try:
+            yield len(doc), lambda idx: doc[idx].get_textpage().get_text_range()
+        finally:
+            doc.close()
+    else:
+        import pdfplumber
+
+        with pdfplumber.open(pdf_path) as pdf:
+            yield len(pdf.pages), lambda idx: pdf.pages[idx].extract_text() or ""
+
+
+# Pages shown after the one where a references marker was found
+CONTEXT_PAGES = 2
+
+
+def report_page(page_idx: int, text: str) -> bool:
+    """
+    Print a page's lines and any reference markers / citation-like lines on it.
+
+    Output is collected and written to stdout once per page.
+    Returns True if the page contains a references marker.
+    """
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    
+    out = [f"\n--- PAGE {page_idx + 1} ---"]
+    
+    # Show all lines for the last few pages
+    out.extend(f"{i+1:2d}: {line}" for i, line in enumerate(lines))
+    
+    # Look for reference markers and citation patterns; lines are
+    # identified by their start offset so each is reported once
+    page_body = "\n".join(lines)
+    marker_lines = set()
+    for match in INDICATOR_RE.finditer(page_body):
+        line_start = page_body.rfind('\n', 0, match.start()) + 1
+        if line_start not in marker_lines:
+            marker_lines.add(line_start)
+            line_end = page_body.find('\n', match.end())
+            line_clean = page_body[line_start:line_end if line_end != -1 else None]
+            out.append(f"\n*** FOUND POTENTIAL REFERENCES MARKER: '{line_clean}' ***")
+    
+    citation_lines = {
+        page_body.rfind('\n', 0, match.start()) + 1 for match in CITATION_RE.finditer(page_body)
+    }
+    citation_count = len(citation_lines)
+    
+    if citation_count > 3:
+        out.append(f"\n*** PAGE HAS {citation_count} CITATION-LIKE LINES ***")
+    
+    sys.stdout.write("\n".join(out) + "\n")
+    return bool(marker_lines)
+
+
 def find_references_in_pdf(pdf_path: str):
     """Find where references start in this specific PDF."""
-    print(f"Searching for references in: {pdf_path}")
-    print("=" * 60)
+    sys.stdout.write(f"Searching for references in: {pdf_path}\n{'=' * 60}\n")
     
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-            print(f"Total pages: {total_pages}")
-            print()
+        with open_pdf_pages(pdf_path) as (total_pages, page_text):
+            sys.stdout.write(f"Total pages: {total_pages}\n\n")
             
             # Look at the last several pages to find references
             start_page = max(0, total_pages - 10)
+            found_page = None
             
             for page_idx in range(start_page, total_pages):
-                page = pdf.pages[page_idx]
-                page_text = page.extract_text() or ""
-                lines = [line.strip() for line in page_text.split('\n') if line.strip()]
+                text = page_text(page_idx)
+                if not text.strip():
+                    # Blank pages (figures, separators) have nothing to scan
+                    sys.stdout.write(f"\n--- PAGE {page_idx + 1} --- (no text)\n")
+                    continue
                 
-                print(f"\n--- PAGE {page_idx + 1} ---")
-                
-                # Show all lines for the last few pages
-                for i, line in enumerate(lines):
-                    print(f"{i+1:2d}: {line}")
-                
-                # Look for reference patterns
-                ref_indicators = [
-                    'References',
-                    'REFERENCES', 
-                    'Bibliography',
-                    'BIBLIOGRAPHY'
-                ]
-                
-                for line in lines:
-                    line_clean = line.strip()
-                    if any(indicator in line_clean for indicator in ref_indicators):
-                        print(f"\n*** FOUND POTENTIAL REFERENCES MARKER: '{line_clean}' ***")
-                
-                # Look for citation patterns
-                citation_count = 0
-                for line in lines:
-                    # Common academic citation patterns
-                    if (re.search(r'[A-Z][a-z]+.*\(\d{4}\)', line) or  # Author (year)
-                        re.search(r'[A-Z][a-z]+.*,\s*\d{4}', line) or    # Author, year
-                        re.search(r'^\d+\.\s*[A-Z]', line) or             # 1. Author
-                        re.search(r'^\[\d+\]', line)):                    # [1]
-                        citation_count += 1
-                
-                if citation_count > 3:
-                    print(f"\n*** PAGE HAS {citation_count} CITATION-LIKE LINES ***")
+                # Stop scanning once the references start; the next few
+                # pages are shown below for context
+                if report_page(page_idx, text):
+                    found_page = page_idx
+                    break
                 
                 if page_idx >= start_page + 3:  # Only show a few pages
-                    print("\n... (truncated)")
+                    sys.stdout.write("\n... (truncated)\n")
                     break
+            
+            if found_page is not None:
+                sys.stdout.write(f"\n*** REFERENCES START ON PAGE {found_page + 1} ***\n")
+                for page_idx in range(found_page + 1, min(found_page + 1 + CONTEXT_PAGES, total_pages)):
+                    report_page(page_idx, page_text(page_idx))
                     
     except Exception as e:
-        print(f"Error analyzing PDF: {e}")
+        sys.stdout.write(f"Error analyzing PDF: {e}\n")
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python find_references.py <pdf_path>")
+    if len(sys.argv) < 2:
+        sys.stdout.write("Usage: python find_references.py <pdf_path> [<pdf_path> ...]\n")
         sys.exit(1)
     
-    pdf_path = sys.argv[1]
-    if not Path(pdf_path).exists():
-        print(f"File not found: {pdf_path}")
+    pdf_paths = sys.argv[1:]
+    missing = [p for p in pdf_paths if not Path(p).exists()]
+    if missing:
+        for pdf_path in missing:
+            sys.stdout.write(f"File not found: {pdf_path}\n")
         sys.exit(1)
     
-    find_references_in_pdf(pdf_path)
\ No newline at end of file
+    for pdf_path in pdf_paths:
+        find_references_in_pdf(pdf_path)
@@ -0,0 +1,72 @@
+"""
+On-disk cache for results that are expensive to recompute.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+
+def default_cache_dir() -> Path:
+    """Return the cache directory (respects XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "service-utils"
+
+
+def file_sha256(file_path: Union[str, Path]) -> str:
+    """Hash a file's contents without reading it into memory at once."""
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    JSON store with one file per key under cache_dir.
+
+    Read and write failures are treated as cache misses so a broken or
+    read-only cache directory never stops a command from running.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached value for key, or None on a miss.
+
+        With max_age (seconds), entries written longer ago than that count as
+        misses and are deleted.
+        """
+        path = self._path(key)
+        try:
+            if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+                path.unlink()
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store value under key."""
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename so parallel runs never see a partial file
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
@@ -2,20 +2,27 @@
 Command-line interface for service-utils.
 """
 
-import os
+import io
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import click
-from rich.console import Console
 
-from rich.table import Table
 
-from .pdf_checker import PDFChecker, PaperType
+# Forum links in result tables are this prefix plus the paper's note id
+FORUM_URL = "https://openreview.net/forum?id="
 
 
-console = Console()
+# Heavy modules (rich, pdfplumber via pdf_checker, openreview) are imported
+# inside the commands that use them so `service-utils --help` stays fast.
+@lru_cache(maxsize=1)
+def _get_console():
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 @click.group()
@@ -43,7 +50,41 @@ def main():
     is_flag=True,
     help="Suppress output, only show summary"
 )
-def check_pdf(path: str, paper_type: str, output: Optional[str], quiet: bool):
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of PDFs to check in parallel (default: number of CPUs)"
+)
+@click.option(
+    "--recursive", "-r",
+    is_flag=True,
+    help="Also check PDFs in subdirectories when PATH is a directory"
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-check every PDF instead of reusing results for unchanged files"
+)
+@click.option(
+    "--skip", "skipped_checks",
+    type=click.Choice(
+        ["page_limit", "missing_limitations", "anonymization", "broken_references", "ethical_considerations"],
+        case_sensitive=False,
+    ),
+    multiple=True,
+    help="Check to leave out (can be given more than once)"
+)
+def check_pdf(
+    path: str,
+    paper_type: str,
+    output: Optional[str],
+    quiet: bool,
+    jobs: Optional[int],
+    recursive: bool,
+    no_cache: bool,
+    skipped_checks: Tuple[str, ...],
+):
     """
     Check PDF submission requirements.
     
@@ -59,20 +100,40 @@ def check_pdf(path: str, paper_type: str, output: Optional[str], quiet: bool):
         
         # Check all PDFs in a directory
         service-utils check-pdf ./submissions/ --type long
+        
+        # Check a submission tree, including subdirectories
+        service-utils check-pdf ./submissions/ --recursive
+        
+        # Check a directory using 4 worker processes
+        service-utils check-pdf ./submissions/ --jobs 4
+        
+        # Ignore results cached from earlier runs
+        service-utils check-pdf ./submissions/ --no-cache
+        
+        # Leave out the anonymization and ethics checks
+        service-utils check-pdf ./submissions/ --skip anonymization --skip ethical_considerations
     """
-    if quiet:
-        console = Console(file=open(os.devnull, 'w'))
-    else:
-        console = Console()
-    
-    checker = PDFChecker(console=console)
-    paper_type_enum = PaperType.SHORT if paper_type.lower() == "short" else PaperType.LONG
+    from rich.console import Console
+
+    from .cache import ResultCache
+    from .pdf_checker import IssueType, PDFChecker, PaperType, find_pdfs
+
+    # click has already validated the choices; PaperType and IssueType values
+    # are the choices
+    console = Console(quiet=True) if quiet else _get_console()
+    skipped = {IssueType(check.lower()) for check in skipped_checks}
+    checker = PDFChecker(
+        console=console,
+        cache=None if no_cache else ResultCache(),
+        checks=[check for check in IssueType if check not in skipped],
+    )
+    paper_type_enum = PaperType(paper_type.lower())
     
     path_obj = Path(path)
     
     if path_obj.is_file():
         # Check single file
-        if not path.lower().endswith('.pdf'):
+        if path_obj.suffix.lower() != '.pdf':
             console.print("[red]Error: File must be a PDF[/red]")
             raise click.Abort()
         
@@ -83,7 +144,17 @@ def check_pdf(path: str, paper_type: str, output: Optional[str], quiet: bool):
     elif path_obj.is_dir():
         # Check directory
         console.print(f"[blue]Checking directory: {path}[/blue]")
-        results = checker.check_directory(path, paper_type_enum)
+        pdfs = find_pdfs(path_obj, recursive)
+        if not pdfs:
+            console.print(f"[yellow]Warning: No PDF files found in '{path}'[/yellow]")
+        else:
+            console.print(f"[blue]Found {len(pdfs)} PDF(s)[/blue]")
+        # Show each PDF's issues as soon as it finishes rather than after the
+        # slowest one; only the summary table is left for the end
+        results = checker.check_files(
+            pdfs, paper_type_enum, jobs=jobs,
+            on_result=None if quiet else checker.print_issues,
+        )
         
     else:
         console.print("[red]Error: Path must be a file or directory[/red]")
@@ -95,7 +166,10 @@ def check_pdf(path: str, paper_type: str, output: Optional[str], quiet: bool):
     
     # Print results
     if not quiet:
-        checker.print_results(results)
+        if path_obj.is_dir():
+            checker.print_summary(results)
+        else:
+            checker.print_results(results)
     
     # Save to output file if requested
     if output:
@@ -117,6 +191,8 @@ def _openreview_ac_setup():
         get_ac_paper_assignments,
     )
 
+    console = _get_console()
+
     try:
         client = get_client()
     except RuntimeError as e:
@@ -164,6 +240,8 @@ def _openreview_reviewer_setup():
         get_reviewer_paper_assignments,
     )
 
+    console = _get_console()
+
     try:
         client = get_client()
     except RuntimeError as e:
@@ -205,6 +283,7 @@ def _select_papers(client, paper_ids):
     """
     from .openreview_client import get_paper_summaries
 
+    console = _get_console()
     console.print("[blue]Fetching paper list...[/blue]")
     summaries = get_paper_summaries(client, paper_ids)
 
@@ -253,6 +332,8 @@ def pull_reviewer_reviews(output_dir: str, paper_filter: str):
     """Pull all reviews for papers you're assigned to as a Reviewer and save as markdown files."""
     from .openreview_client import get_paper_reviews, filter_paper_ids_by_number
 
+    console = _get_console()
+
     setup = _openreview_reviewer_setup()
     if setup is None:
         return
@@ -278,13 +359,7 @@ def pull_reviewer_reviews(output_dir: str, paper_filter: str):
     out = Path(output_dir)
     out.mkdir(parents=True, exist_ok=True)
 
-    for paper in papers:
-        md = _render_paper_markdown(paper)
-        safe_title = re.sub(r"[^\w\s-]", "", paper["title"])[:60].strip().replace(" ", "_")
-        filename = f"paper_{paper['paper_number']}_{safe_title}.md"
-        filepath = out / filename
-        filepath.write_text(md, encoding="utf-8")
-        console.print(f"  [green]Saved: {filepath}[/green]")
+    _save_papers_markdown(papers, out)
 
     console.print(f"\n[green]Done! {len(papers)} paper(s) saved to {out}/[/green]")
 
@@ -308,17 +383,47 @@ def pull_reviewer_reviews(output_dir: str, paper_filter: str):
     default=False,
     help="Post a private comment on each paper's forum (visible to SACs/PCs/ACs) indicating you've contacted late reviewers.",
 )
-def missing_reviews(send_email: str, test_email: str, post_comment: bool):
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=3,
+    show_default=True,
+    help="Number of parallel SMTP connections used with --send-email.",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Re-fetch reviewer profiles instead of using emails/names cached by recent runs.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Neither read nor store reviewer emails/names in the on-disk cache.",
+)
+def missing_reviews(
+    send_email: str, test_email: str, post_comment: bool, concurrency: int, refresh: bool,
+    no_cache: bool,
+):
     """Find reviewers with missing reviews for your AC papers."""
+    from rich.table import Table
+
+    from .cache import ResultCache
     from .openreview_client import get_missing_reviews, post_ac_comment
 
+    console = _get_console()
+
     setup = _openreview_ac_setup()
     if setup is None:
         return
     client, user_id, venue_id, paper_ids = setup
 
     console.print("[blue]Checking for missing reviews...[/blue]")
-    missing = get_missing_reviews(client, venue_id, paper_ids)
+    missing = get_missing_reviews(
+        client, venue_id, paper_ids,
+        profile_cache=None if no_cache else ResultCache(), refresh_profiles=refresh,
+    )
 
     if not missing:
         console.print("[green]All reviewers have submitted their reviews![/green]")
@@ -332,16 +437,19 @@ def missing_reviews(send_email: str, test_email: str, post_comment: bool):
     table.add_column("Reviewer Email", style="red")
     table.add_column("Flag", style="bright_red")
 
-    for entry in missing:
-        link = f"https://openreview.net/forum?id={entry['paper_id']}"
-        table.add_row(
-            str(entry["paper_number"]),
-            entry["paper_title"],
-            link,
-            entry["reviewer_name"],
-            entry["reviewer_email"],
-            entry["flag"],
+    rows = [
+        (
+            str(e["paper_number"]),
+            e["paper_title"],
+            FORUM_URL + e["paper_id"],
+            e["reviewer_name"],
+            e["reviewer_email"],
+            e["flag"],
         )
+        for e in missing
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print(f"\n[red]Total missing reviews: {len(missing)}[/red]")
@@ -370,6 +478,7 @@ def missing_reviews(send_email: str, test_email: str, post_comment: bool):
             password=password,
             missing_entries=missing,
             test_email=test_email,
+            concurrency=concurrency,
         )
         for result in email_results:
             target = result[0]
@@ -431,11 +540,15 @@ def missing_reviews(send_email: str, test_email: str, post_comment: bool):
 )
 def nudge_reviewers(dry_run: bool, post_comment: bool):
     """Find reviewers who haven't responded to author rebuttals and nudge them."""
+    from rich.table import Table
+
     from .openreview_client import (
         get_reviewers_without_response,
         post_reviewer_rebuttal_comment,
     )
 
+    console = _get_console()
+
     setup = _openreview_ac_setup()
     if setup is None:
         return
@@ -454,14 +567,17 @@ def nudge_reviewers(dry_run: bool, post_comment: bool):
     table.add_column("OpenReview Link", style="blue")
     table.add_column("Reviewer ID", style="yellow")
 
-    for entry in non_responsive:
-        link = f"https://openreview.net/forum?id={entry['paper_id']}"
-        table.add_row(
-            str(entry["paper_number"]),
-            entry["paper_title"],
-            link,
-            entry["reviewer_id"],
+    rows = [
+        (
+            str(e["paper_number"]),
+            e["paper_title"],
+            FORUM_URL + e["paper_id"],
+            e["reviewer_id"],
         )
+        for e in non_responsive
+    ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print(f"\n[red]Total non-responsive reviewers: {len(non_responsive)}[/red]")
@@ -524,6 +640,8 @@ def pull_reviews(output_dir: str, paper_filter: str):
     """Pull reviews for your AC papers and save as markdown files."""
     from .openreview_client import get_paper_reviews, filter_paper_ids_by_number
 
+    console = _get_console()
+
     setup = _openreview_ac_setup()
     if setup is None:
         return
@@ -550,101 +668,139 @@ def pull_reviews(output_dir: str, paper_filter: str):
     out = Path(output_dir) / safe_venue
     out.mkdir(parents=True, exist_ok=True)
 
-    for paper in papers:
-        md = _render_paper_markdown(paper)
-        safe_title = re.sub(r"[^\w\s-]", "", paper["title"])[:60].strip().replace(" ", "_")
-        filename = f"paper_{paper['paper_number']}_{safe_title}.md"
-        filepath = out / filename
-        filepath.write_text(md, encoding="utf-8")
-        console.print(f"  [green]Saved: {filepath}[/green]")
+    _save_papers_markdown(papers, out)
 
     console.print(f"\n[green]Done! {len(papers)} paper(s) saved to {out}/[/green]")
 
 
+class _TitleCharTable(dict):
+    """
+    str.translate table that drops every character except word characters,
+    whitespace and '-' (the characters the regex [\\w\\s-] keeps). Entries are
+    computed on first use, so later lookups stay inside str.translate.
+    """
+
+    def __missing__(self, code):
+        char = chr(code)
+        keep = char.isalnum() or char.isspace() or char in "_-"
+        self[code] = char if keep else None
+        return self[code]
+
+
+_TITLE_CHARS = _TitleCharTable()
+
+
+def _save_papers_markdown(papers, out: Path) -> None:
+    """
+    Render each paper's thread and write it to out/paper_<number>_<title>.md.
+
+    Files are written on a small thread pool so disk (or network share)
+    latency overlaps with rendering the next paper.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    console = _get_console()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        writes = []
+        for paper in papers:
+            md = _render_paper_markdown(paper)
+            safe_title = paper["title"].translate(_TITLE_CHARS)[:60].strip().replace(" ", "_")
+            filename = f"paper_{paper['paper_number']}_{safe_title}.md"
+            filepath = out / filename
+            writes.append((filepath, executor.submit(filepath.write_text, md, encoding="utf-8")))
+
+        for filepath, write in writes:
+            write.result()
+            console.print(f"  [green]Saved: {filepath}[/green]")
+
+
+class _PrettyKeyTable(dict):
+    """Content key -> display label ("soundness_rating" -> "Soundness Rating"), filled on first use."""
+
+    def __missing__(self, key):
+        self[key] = key.replace("_", " ").title()
+        return self[key]
+
+
+# Review forms reuse the same handful of field names across every note
+_PRETTY_KEYS = _PrettyKeyTable()
+
+
+def _render_content(buf, content: dict, long_as_heading: bool = True) -> None:
+    """
+    Write a note's content fields as markdown blocks (each followed by a
+    blank line). Short values (scores, ratings) become bold key-value pairs;
+    long ones get a ### heading, or are written bare if long_as_heading is False.
+    """
+    for key, val in content.items():
+        if not val:
+            continue
+        pretty_key = _PRETTY_KEYS[key]
+        val_str = str(val)
+        if len(val_str) < 100 and "\n" not in val_str:
+            buf.write(f"**{pretty_key}:** {val_str}\n\n")
+        elif long_as_heading:
+            buf.write(f"### {pretty_key}\n\n{val_str}\n\n")
+        else:
+            buf.write(f"{val_str}\n\n")
+
+
 def _render_paper_markdown(paper: dict) -> str:
     """Render a paper's full discussion thread as markdown."""
-    lines = []
-    lines.append(f"# Paper {paper['paper_number']}: {paper['title']}\n")
-    lines.append(f"**Authors:** {paper['authors']}\n")
-    lines.append(f"## Abstract\n\n{paper['abstract']}\n")
+    # Every block ends with a blank line; the final newline is dropped below
+    buf = io.StringIO()
+    buf.write(f"# Paper {paper['paper_number']}: {paper['title']}\n\n")
+    buf.write(f"**Authors:** {paper['authors']}\n\n")
+    buf.write(f"## Abstract\n\n{paper['abstract']}\n\n")
 
     # Reviews
     for i, review in enumerate(paper["reviews"], 1):
         sig = ", ".join(review["signatures"])
-        lines.append(f"---\n\n## Review {i} ({sig})\n")
-        content = review["content"]
-        for key, val in content.items():
-            if not val:
-                continue
-            pretty_key = key.replace("_", " ").title()
-            # Short values (scores, ratings) as bold key-value pairs
-            val_str = str(val)
-            if len(val_str) < 100 and "\n" not in val_str:
-                lines.append(f"**{pretty_key}:** {val_str}\n")
-            else:
-                lines.append(f"### {pretty_key}\n\n{val_str}\n")
+        buf.write(f"---\n\n## Review {i} ({sig})\n\n")
+        _render_content(buf, review["content"])
 
     # Meta reviews
     for i, meta in enumerate(paper["meta_reviews"], 1):
         sig = ", ".join(meta["signatures"])
-        lines.append(f"---\n\n## Meta Review {i} ({sig})\n")
-        for key, val in meta["content"].items():
-            if not val:
-                continue
-            pretty_key = key.replace("_", " ").title()
-            val_str = str(val)
-            if len(val_str) < 100 and "\n" not in val_str:
-                lines.append(f"**{pretty_key}:** {val_str}\n")
-            else:
-                lines.append(f"### {pretty_key}\n\n{val_str}\n")
+        buf.write(f"---\n\n## Meta Review {i} ({sig})\n\n")
+        _render_content(buf, meta["content"])
 
     # Decisions
     for decision in paper["decisions"]:
         sig = ", ".join(decision["signatures"])
-        lines.append(f"---\n\n## Decision ({sig})\n")
-        for key, val in decision["content"].items():
-            if not val:
-                continue
-            pretty_key = key.replace("_", " ").title()
-            val_str = str(val)
-            if len(val_str) < 100 and "\n" not in val_str:
-                lines.append(f"**{pretty_key}:** {val_str}\n")
-            else:
-                lines.append(f"### {pretty_key}\n\n{val_str}\n")
+        buf.write(f"---\n\n## Decision ({sig})\n\n")
+        _render_content(buf, decision["content"])
 
     # Comments
     if paper["comments"]:
-        lines.append("---\n\n## Comments\n")
+        buf.write("---\n\n## Comments\n\n")
         for comment in paper["comments"]:
             sig = ", ".join(comment["signatures"])
-            lines.append(f"### Comment by {sig}\n")
-            for key, val in comment["content"].items():
-                if not val:
-                    continue
-                pretty_key = key.replace("_", " ").title()
-                val_str = str(val)
-                if len(val_str) < 100 and "\n" not in val_str:
-                    lines.append(f"**{pretty_key}:** {val_str}\n")
-                else:
-                    lines.append(f"{val_str}\n")
+            buf.write(f"### Comment by {sig}\n\n")
+            _render_content(buf, comment["content"], long_as_heading=False)
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]
 
 
 def save_results_to_file(results, output_path: str):
-    """Save results to a JSON file."""
+    """Save results to a JSON file (uses orjson when installed)."""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    
+    if orjson is not None:
+        # orjson serializes dataclasses and enums natively, so the results can
+        # be dumped as-is without building an intermediate copy
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(list(results), option=orjson.OPT_INDENT_2))
+        return
+    
     import json
-    from dataclasses import asdict
     
-    # Convert results to JSON-serializable format
-    json_results = []
-    for result in results:
-        result_dict = asdict(result)
-        # Convert enums to strings
-        result_dict['paper_type'] = result.paper_type.value
-        for issue in result_dict['issues']:
-            issue['issue_type'] = issue['issue_type'].value
-        json_results.append(result_dict)
+    # Convert results to JSON-serializable format (enums become their values)
+    json_results = [result.to_dict() for result in results]
     
     with open(output_path, 'w') as f:
         json.dump(json_results, f, indent=2)
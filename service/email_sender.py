@@ -2,8 +2,13 @@
 SMTP email sender for review reminder emails.
 """
 
+import queue
 import smtplib
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
+from email.policy import SMTP as SMTP_POLICY
 from pathlib import Path
 
 SMTP_SERVERS = {
@@ -13,42 +18,149 @@ SMTP_SERVERS = {
     "yahoo.com": ("smtp.mail.yahoo.com", 587),
 }
 
+# Providers that accept implicit TLS, which saves the STARTTLS round trip
+# (and second EHLO) on every session. Outlook only offers STARTTLS.
+SMTP_SSL_PORT = 465
+SMTP_SSL_SERVERS = {
+    "gmail.com": ("smtp.gmail.com", SMTP_SSL_PORT),
+    "yahoo.com": ("smtp.mail.yahoo.com", SMTP_SSL_PORT),
+}
+
 
-def _get_smtp_server(email: str):
-    """Return (host, port) for the given email address."""
+def _get_smtp_server(email: str, use_ssl: bool = True):
+    """
+    Return (host, port) for the given email address.
+
+    With use_ssl, providers known to support it get their implicit-TLS port
+    (SMTP_SSL_PORT); everything else uses STARTTLS on 587.
+    """
     domain = email.rsplit("@", 1)[1].lower()
+    if use_ssl and domain in SMTP_SSL_SERVERS:
+        return SMTP_SSL_SERVERS[domain]
     if domain in SMTP_SERVERS:
         return SMTP_SERVERS[domain]
     return (f"smtp.{domain}", 587)
 
 
-def send_reminder_emails(sender_email, sender_name, password, missing_entries, test_email=None):
+# Errors meaning the SMTP session itself is gone (idle timeout, reset), as
+# opposed to a rejected message; these are worth one reconnect and retry
+_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout)
+
+# Sessions idle longer than this get a NOOP health check before the next
+# send; providers drop idle connections after a minute or so
+_IDLE_CHECK_SECONDS = 30
+
+
+class _MessageNotSent(smtplib.SMTPServerDisconnected):
+    """The session dropped before the message was fully written, so it was not delivered."""
+
+
+def _connect(host, port, sender_email, password):
+    """Open an authenticated SMTP session (implicit TLS on SMTP_SSL_PORT, else STARTTLS)."""
+    if port == SMTP_SSL_PORT:
+        server = smtplib.SMTP_SSL(host, port)
+    else:
+        server = smtplib.SMTP(host, port)
+        server.starttls()
+    server.login(sender_email, password)
+    return server
+
+
+def _ensure_alive(server, host, port, sender_email, password):
+    """Return server if its session still answers NOOP, else a fresh session."""
+    try:
+        if server.noop()[0] == 250:
+            return server
+    except _CONNECTION_ERRORS:
+        pass
+    try:
+        server.close()
+    except Exception:
+        pass
+    return _connect(host, port, sender_email, password)
+
+
+def _send_message(server, sender_email, recipient, message):
+    """
+    Send one message (CRLF-terminated bytes) to a single recipient.
+
+    When the server advertises PIPELINING and CHUNKING (RFC 2920 / 3030),
+    MAIL FROM, RCPT TO and a single BDAT ... LAST chunk are written at once
+    and the three replies read back together: one round trip per message
+    instead of sendmail()'s four, and no dot-stuffing pass over the body.
+    Other servers get a plain sendmail(). Raises the same exceptions as
+    sendmail(); _MessageNotSent means the session failed before the message
+    was written and it is safe to send again.
+    """
+    if not (server.has_extn("pipelining") and server.has_extn("chunking")):
+        server.sendmail(sender_email, [recipient], message)
+        return
+
+    # send() bypasses putcmd(), so apply its newline guard here: a CR or LF
+    # in an address would otherwise inject commands into the session
+    if any(char in address for address in (sender_email, recipient) for char in "\r\n"):
+        raise ValueError("email address contains prohibited newline characters")
+    if not message.endswith(b"\r\n"):
+        message += b"\r\n"  # sendmail() terminates the body the same way
+    try:
+        server.send(
+            f"MAIL FROM:{smtplib.quoteaddr(sender_email)}\r\n"
+            f"RCPT TO:{smtplib.quoteaddr(recipient)}\r\n"
+            f"BDAT {len(message)} LAST\r\n".encode("ascii") + message
+        )
+    except _CONNECTION_ERRORS as e:
+        # At most part of the BDAT chunk went out, so the server cannot have
+        # accepted the message; a failure while reading the replies below
+        # gives no such guarantee and is raised as is
+        raise _MessageNotSent(str(e)) from e
+    # The server answers every pipelined command, even after a rejection
+    mail_reply, rcpt_reply, data_reply = [server.getreply() for _ in range(3)]
+    if mail_reply[0] == 250 and rcpt_reply[0] in (250, 251) and data_reply[0] == 250:
+        return
+
+    # Report the rejection itself, not a failure of the cleanup after it
+    try:
+        server.rset()
+    except Exception:
+        pass
+    if mail_reply[0] != 250:
+        raise smtplib.SMTPSenderRefused(*mail_reply, sender_email)
+    if rcpt_reply[0] not in (250, 251):
+        raise smtplib.SMTPRecipientsRefused({recipient: rcpt_reply})
+    raise smtplib.SMTPDataError(*data_reply)
+
+
+def send_reminder_emails(
+    sender_email, sender_name, password, missing_entries, test_email=None, concurrency=3
+):
     """
     Send reminder emails via SMTP.
 
+    Messages are sent over up to `concurrency` SMTP sessions in parallel
+    (keep this low: providers rate-limit concurrent logins).
     If test_email is provided, all emails are sent to that address instead.
-    Returns list of (recipient_email, success_bool[, error_str]) tuples.
+    Returns list of (recipient_email, success_bool[, error_str]) tuples,
+    in the order of missing_entries.
     """
     host, port = _get_smtp_server(sender_email)
-    results = []
 
     try:
-        server = smtplib.SMTP(host, port)
-        server.starttls()
-        server.login(sender_email, password)
+        server = _connect(host, port, sender_email, password)
     except Exception as e:
         return [(entry["reviewer_email"], False, f"SMTP login failed: {e}") for entry in missing_entries]
 
     template_path = Path(__file__).parent / "templates" / "reminder_email.txt"
     template = template_path.read_text()
 
-    for entry in missing_entries:
+    results = [None] * len(missing_entries)
+    outgoing = []  # (index, recipient, message)
+    for index, entry in enumerate(missing_entries):
         if entry.get("flag") == "Emergency":
-            results.append((entry["reviewer_email"], False, "Skipped: reviewer declared emergency"))
+            results[index] = (entry["reviewer_email"], False, "Skipped: reviewer declared emergency")
             continue
         recipient = test_email if test_email else entry["reviewer_email"]
         if "*" in recipient or "@" not in recipient:
-            results.append((recipient, False, "No valid email address available (masked or missing)"))
+            results[index] = (recipient, False, "No valid email address available (masked or missing)")
             continue
         subject = f"Review reminder: {entry['paper_title']}"
         body = template.format(
@@ -61,12 +173,48 @@ def send_reminder_emails(sender_email, sender_name, password, missing_entries, t
         msg["Subject"] = subject
         msg["From"] = sender_email
         msg["To"] = recipient
+        outgoing.append((index, recipient, msg.as_bytes(policy=SMTP_POLICY)))
 
+    # Pool of (session, last used) pairs; each send borrows one and returns it.
+    # Extra sessions are best effort — the batch proceeds with what logs in.
+    pool = queue.Queue()
+    pool.put((server, time.monotonic()))
+    sessions = [server]
+    for _ in range(min(concurrency, len(outgoing)) - 1):
         try:
-            server.sendmail(sender_email, [recipient], msg.as_string())
-            results.append((recipient, True))
+            extra = _connect(host, port, sender_email, password)
+        except Exception:
+            break
+        pool.put((extra, time.monotonic()))
+        sessions.append(extra)
+
+    def send(job):
+        index, recipient, message = job
+        server, last_used = pool.get()
+        try:
+            # Providers drop idle sessions; check before sending rather than
+            # resending after a failure that may follow a delivered message
+            if time.monotonic() - last_used > _IDLE_CHECK_SECONDS:
+                server = _ensure_alive(server, host, port, sender_email, password)
+            try:
+                _send_message(server, sender_email, recipient, message)
+            except _MessageNotSent:
+                # The message never reached the server, so one retry cannot duplicate it
+                server = _ensure_alive(server, host, port, sender_email, password)
+                _send_message(server, sender_email, recipient, message)
+            results[index] = (recipient, True)
         except Exception as e:
-            results.append((recipient, False, str(e)))
+            results[index] = (recipient, False, str(e))
+        finally:
+            pool.put((server, time.monotonic()))
 
-    server.quit()
+    with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
+        list(executor.map(send, outgoing))
+
+    # Sessions may have been replaced by reconnects; close what is pooled now
+    while not pool.empty():
+        try:
+            pool.get_nowait()[0].quit()
+        except _CONNECTION_ERRORS:
+            pass
     return results
@@ -2,46 +2,216 @@
 OpenReview API interaction for finding missing reviews and pulling reviews.
 """
 
+import hashlib
 import os
-import re
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 import openreview
 from openreview.api import OpenReviewClient
 
+# Papers fetched concurrently (each may overlap a few of its own requests);
+# the overall request rate is capped separately by OPENREVIEW_RPS
+MAX_CONCURRENT_REQUESTS = 10
+
+# How long cached reviewer emails/names are trusted (seconds)
+PROFILE_CACHE_TTL = 12 * 60 * 60
+
+# How long fetched submission notes are reused within this process (seconds).
+# Commands that let you pick papers look each one up again afterwards.
+# Each client (login) has its own cache, capped at NOTE_CACHE_MAXSIZE notes.
+NOTE_CACHE_TTL = 5 * 60
+NOTE_CACHE_MAXSIZE = 10000
+# client -> {note id: (time.monotonic() when fetched, note)}, oldest first
+_note_caches = weakref.WeakKeyDictionary()
+_note_cache_lock = threading.Lock()
+
+# Note IDs per batched notes request
+NOTES_BATCH_SIZE = 100
+
+# Invitation suffixes of the forum notes get_missing_reviews looks for
+_REVIEW_SUFFIX = "/-/Official_Review"
+_EMERGENCY_SUFFIX = "/-/Emergency_Declaration"
+
+# Name prefixes of the anonymous groups under <venue>/Submission<N>/
+_ANON_GROUP_KINDS = ("Reviewer_", "Area_Chair_", "Senior_Area_Chair_")
+
+# Retries for a rate-limited (429) or failing (5xx) API call, with
+# exponential backoff (1s, 2s, 4s, ...) between attempts
+MAX_RETRIES = 4
+
+
+class _Throttle:
+    """
+    Token bucket capping API calls at rps per second across threads.
+
+    Tokens refill continuously up to a burst of rps (at least one call, so
+    rates below 1/sec still let calls through); acquire() blocks until one
+    is available.
+    """
+
+    def __init__(self, rps):
+        if rps <= 0:
+            raise ValueError(f"rate must be positive, got {rps}")
+        self.rps = rps
+        self.capacity = max(1, rps)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rps)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rps
+            time.sleep(wait)
+
+
+_throttle = None
+_throttle_lock = threading.Lock()
+
+
+def _get_throttle():
+    """
+    Return the shared rate limiter, built from OPENREVIEW_RPS on first use.
+
+    Raises RuntimeError if OPENREVIEW_RPS is not a positive number.
+    """
+    global _throttle
+
+    with _throttle_lock:
+        if _throttle is None:
+            value = os.environ.get("OPENREVIEW_RPS", "10")
+            try:
+                rps = float(value)
+            except ValueError:
+                rps = 0
+            if not rps > 0:
+                raise RuntimeError(
+                    f"OPENREVIEW_RPS must be a positive number of requests per second, got {value!r}"
+                )
+            _throttle = _Throttle(rps)
+        return _throttle
+
+
+def _is_retryable(error):
+    """True for OpenReview errors caused by rate limiting or a server fault."""
+    details = error.args[0] if error.args else None
+    status = details.get("status") if isinstance(details, dict) else None
+    return status is not None and (status == 429 or status >= 500)
+
+
+def _call(fn, *args, **kwargs):
+    """
+    Call an OpenReview API function under the shared rate limit
+    (OPENREVIEW_RPS, default 10 calls/sec), retrying rate-limited calls.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        _get_throttle().acquire()
+        try:
+            return fn(*args, **kwargs)
+        except openreview.OpenReviewException as e:
+            if attempt == MAX_RETRIES or not _is_retryable(e):
+                raise
+        time.sleep(2 ** attempt)
+
+
+def _is_paper_group(segment):
+    """True for a per-paper group segment such as "Submission1234" or "Paper12"."""
+    for prefix in ("Paper", "Submission"):
+        if segment.startswith(prefix):
+            # Same test as re.match(r"(Paper|Submission)\d+"): a digit follows
+            return segment[len(prefix):len(prefix) + 1].isdecimal()
+    return False
+
+
+# An authenticated client is reused for this long (seconds), well inside the
+# lifetime of the token it holds
+CLIENT_TTL = 50 * 60
+_client = None
+_client_expiry = 0.0
+_client_lock = threading.Lock()
+
+# Connections kept per host: each concurrently fetched paper can have a few
+# requests in flight at once
+HTTP_POOL_SIZE = 4 * MAX_CONCURRENT_REQUESTS
+
+
+def _widen_connection_pools(session, size):
+    """
+    Re-mount the session's HTTP adapters with at least `size` pooled
+    connections, keeping their retry policies. requests pools only 10
+    connections per host by default, so concurrent requests beyond that
+    would open and discard extra connections.
+    """
+    from requests.adapters import HTTPAdapter
+
+    for prefix, adapter in list(session.adapters.items()):
+        if not isinstance(adapter, HTTPAdapter) or getattr(adapter, "_pool_maxsize", 0) >= size:
+            continue
+        session.mount(prefix, HTTPAdapter(
+            pool_connections=getattr(adapter, "_pool_connections", 10),
+            pool_maxsize=size,
+            max_retries=adapter.max_retries,
+        ))
+
 
 def get_client():
-    """Authenticate with OpenReview using environment variables (loads .env if present)."""
-    from dotenv import load_dotenv
-
-    load_dotenv()
-    username = os.environ.get("OPENREVIEW_USERNAME")
-    password = os.environ.get("OPENREVIEW_PASSWORD")
-    if not username or not password:
-        raise RuntimeError(
-            "OPENREVIEW_USERNAME and OPENREVIEW_PASSWORD environment variables must be set"
+    """
+    Authenticate with OpenReview using environment variables (loads .env if present).
+
+    The client is shared by later calls for CLIENT_TTL seconds, so its login
+    and HTTPS connection pool are reused.
+    """
+    global _client, _client_expiry
+
+    with _client_lock:
+        if _client is not None and time.monotonic() < _client_expiry:
+            return _client
+
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _get_throttle()  # report a bad OPENREVIEW_RPS (possibly from .env) up front
+        username = os.environ.get("OPENREVIEW_USERNAME")
+        password = os.environ.get("OPENREVIEW_PASSWORD")
+        if not username or not password:
+            raise RuntimeError(
+                "OPENREVIEW_USERNAME and OPENREVIEW_PASSWORD environment variables must be set"
+            )
+        _client = OpenReviewClient(
+            baseurl="https://api2.openreview.net",
+            username=username,
+            password=password,
         )
-    return OpenReviewClient(
-        baseurl="https://api2.openreview.net",
-        username=username,
-        password=password,
-    )
+        _widen_connection_pools(_client.session, HTTP_POOL_SIZE)
+        _client_expiry = time.monotonic() + CLIENT_TTL
+        return _client
 
 
-def get_reviewer_venues(client, user_id):
+def _get_role_venues(client, user_id, role):
     """
-    Discover all venues where user_id is a Reviewer.
+    Discover the venues where user_id belongs to the venue-level role group
+    (e.g. "Reviewers" or "Area_Chairs"), in reverse of the API's order.
 
     Returns list of dicts: {venue_id, group_id}
     """
-    groups = client.get_groups(member=user_id)
+    suffix = f"/{role}"
+    groups = _call(client.get_groups, member=user_id)
     seen = set()
     venues = []
     for g in groups:
-        if g.id.endswith("/Reviewers"):
-            venue_id = g.id.rsplit("/Reviewers", 1)[0]
-            # Skip paper-level reviewer groups (e.g. .../Submission1234/Reviewers)
-            last_segment = venue_id.rsplit("/", 1)[-1]
-            if re.match(r"(Paper|Submission)\d+", last_segment):
+        if g.id.endswith(suffix):
+            venue_id = g.id[:-len(suffix)]
+            # Skip paper-level groups (e.g. .../Submission1234/Reviewers)
+            if _is_paper_group(venue_id.rpartition("/")[2]):
                 continue
             if venue_id not in seen:
                 seen.add(venue_id)
@@ -49,13 +219,23 @@ def get_reviewer_venues(client, user_id):
     return list(reversed(venues))
 
 
+def get_reviewer_venues(client, user_id):
+    """
+    Discover all venues where user_id is a Reviewer.
+
+    Returns list of dicts: {venue_id, group_id}
+    """
+    return _get_role_venues(client, user_id, "Reviewers")
+
+
 def get_reviewer_paper_assignments(client, venue_id, user_id):
     """
     Get paper IDs assigned to user_id as a Reviewer in the given venue.
 
     Returns list of paper note IDs.
     """
-    edges = client.get_all_edges(
+    edges = _call(
+        client.get_all_edges,
         invitation=f"{venue_id}/Reviewers/-/Assignment",
         tail=user_id,
     )
@@ -68,20 +248,7 @@ def get_area_chair_venues(client, user_id):
 
     Returns list of dicts: {venue_id, group_id}
     """
-    groups = client.get_groups(member=user_id)
-    seen = set()
-    venues = []
-    for g in groups:
-        if g.id.endswith("/Area_Chairs"):
-            venue_id = g.id.rsplit("/Area_Chairs", 1)[0]
-            # Skip paper-level AC groups (e.g. .../Submission1234/Area_Chairs)
-            last_segment = venue_id.rsplit("/", 1)[-1]
-            if re.match(r"(Paper|Submission)\d+", last_segment):
-                continue
-            if venue_id not in seen:
-                seen.add(venue_id)
-                venues.append({"venue_id": venue_id, "group_id": g.id})
-    return list(reversed(venues))
+    return _get_role_venues(client, user_id, "Area_Chairs")
 
 
 def get_ac_paper_assignments(client, venue_id, user_id):
@@ -90,7 +257,8 @@ def get_ac_paper_assignments(client, venue_id, user_id):
 
     Returns list of paper note IDs.
     """
-    edges = client.get_all_edges(
+    edges = _call(
+        client.get_all_edges,
         invitation=f"{venue_id}/Area_Chairs/-/Assignment",
         tail=user_id,
     )
@@ -121,6 +289,18 @@ def _get_profile_email(profile):
     return None
 
 
+def _get_profile_name(profile):
+    """Get "First Last" from a profile's first listed name, or None."""
+    if not hasattr(profile, "content") or not isinstance(profile.content, dict):
+        return None
+    names = profile.content.get("names", [])
+    if not names or not isinstance(names[0], dict):
+        return None
+    first = names[0].get("first", "")
+    last = names[0].get("last", "")
+    return f"{first} {last}".strip()
+
+
 def post_ac_comment(client, venue_id, paper_id, paper_number, user_id):
     """
     Post a private comment on a paper's forum as the AC, visible only to
@@ -129,11 +309,10 @@ def post_ac_comment(client, venue_id, paper_id, paper_number, user_id):
     Returns (paper_number, True) on success or (paper_number, False, error_msg)
     on failure.
     """
+    submission = f"{venue_id}/Submission{paper_number}"
     try:
         # Look up AC's anonymous group for this paper
-        anon_groups = client.get_groups(
-            prefix=f"{venue_id}/Submission{paper_number}/Area_Chair_"
-        )
+        anon_groups = _call(client.get_groups, prefix=f"{submission}/Area_Chair_")
         ac_anon_id = None
         for ag in anon_groups:
             if ag.members and user_id in ag.members:
@@ -148,15 +327,15 @@ def post_ac_comment(client, venue_id, paper_id, paper_number, user_id):
         comment_text = template_path.read_text().strip()
 
         client.post_note_edit(
-            invitation=f"{venue_id}/Submission{paper_number}/-/Official_Comment",
+            invitation=f"{submission}/-/Official_Comment",
             signatures=[ac_anon_id],
             note=openreview.api.Note(
                 forum=paper_id,
                 replyto=paper_id,
                 readers=[
                     f"{venue_id}/Program_Chairs",
-                    f"{venue_id}/Submission{paper_number}/Senior_Area_Chairs",
-                    f"{venue_id}/Submission{paper_number}/Area_Chairs",
+                    f"{submission}/Senior_Area_Chairs",
+                    f"{submission}/Area_Chairs",
                 ],
                 writers=[venue_id, ac_anon_id],
                 signatures=[ac_anon_id],
@@ -170,11 +349,57 @@ def post_ac_comment(client, venue_id, paper_id, paper_number, user_id):
         return (paper_number, False, str(e))
 
 
+def _get_notes(client, note_ids):
+    """
+    Fetch notes by ID in one batched request, returned in note_ids order.
+
+    Notes this client fetched within NOTE_CACHE_TTL are reused; notes the
+    batch didn't return are fetched individually.
+    """
+    note_ids = list(note_ids)
+    now = time.monotonic()
+    notes = {}
+    with _note_cache_lock:
+        cache = _note_caches.setdefault(client, {})
+        for nid in note_ids:
+            hit = cache.get(nid)
+            if hit is not None and now - hit[0] < NOTE_CACHE_TTL:
+                notes[nid] = hit[1]
+
+    missing = [nid for nid in dict.fromkeys(note_ids) if nid not in notes]
+    if missing:
+        # Large ID lists are split into batches (fetched concurrently) so a
+        # single request never runs into the API's page size limit
+        batches = [
+            missing[i:i + NOTES_BATCH_SIZE] for i in range(0, len(missing), NOTES_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=min(len(batches), MAX_CONCURRENT_REQUESTS)) as executor:
+            fetched = {
+                note.id: note
+                for batch in executor.map(lambda ids: _call(client.get_notes_by_ids, ids), batches)
+                for note in batch
+            }
+        for nid in missing:
+            notes[nid] = fetched.get(nid) or _call(client.get_note, nid)
+        with _note_cache_lock:
+            for nid in missing:
+                cache.pop(nid, None)  # re-insert at the end, keeping fetch order
+                cache[nid] = (now, notes[nid])
+            # Evict from the oldest end: expired notes, then any over the cap
+            while cache:
+                nid, (fetched_at, _) = next(iter(cache.items()))
+                if len(cache) <= NOTE_CACHE_MAXSIZE and now - fetched_at < NOTE_CACHE_TTL:
+                    break
+                del cache[nid]
+    return [notes[nid] for nid in note_ids]
+
+
 def _get_note_invitations(note):
-    """Get all invitation strings from a note (handles API v1 and v2)."""
-    inv = getattr(note, "invitation", None) or ""
-    invs = getattr(note, "invitations", None) or []
-    return invs + ([inv] if inv else [])
+    """Yield all invitation strings of a note (handles API v1 and v2)."""
+    inv = getattr(note, "invitation", None)
+    if inv:
+        yield inv
+    yield from getattr(note, "invitations", None) or ()
 
 
 def _extract_content_value(field):
@@ -186,16 +411,16 @@ def _extract_content_value(field):
 
 def _classify_note(note):
     """Classify a note by its invitation type. Returns a category string or None."""
-    all_invs = _get_note_invitations(note)
-    patterns = [
-        (r"/-/Official_Review$", "review"),  # NeurIPS, ICLR, etc.
-        (r"/-/Review$", "review"),            # ARR, TMLR, etc.
-        (r"/-/Meta_Review$", "meta_review"),
-        (r"/-/Decision$", "decision"),
-        (r"/-/Official_Comment$", "comment"),
+    all_invs = tuple(_get_note_invitations(note))
+    suffixes = [
+        ("/-/Official_Review", "review"),  # NeurIPS, ICLR, etc.
+        ("/-/Review", "review"),            # ARR, TMLR, etc.
+        ("/-/Meta_Review", "meta_review"),
+        ("/-/Decision", "decision"),
+        ("/-/Official_Comment", "comment"),
     ]
-    for pattern, category in patterns:
-        if any(re.search(pattern, i) for i in all_invs):
+    for suffix, category in suffixes:
+        if any(i.endswith(suffix) for i in all_invs):
             return category
     return None
 
@@ -207,8 +432,7 @@ def get_paper_summaries(client, paper_ids):
     Returns list of dicts: {paper_id, number, title}
     """
     summaries = []
-    for pid in paper_ids:
-        note = client.get_note(pid)
+    for pid, note in zip(paper_ids, _get_notes(client, paper_ids)):
         title = _extract_content_value(note.content.get("title", "Unknown"))
         summaries.append({"paper_id": pid, "number": note.number, "title": title})
     summaries.sort(key=lambda x: x["number"])
@@ -224,8 +448,7 @@ def filter_paper_ids_by_number(client, paper_ids, paper_numbers):
     """
     filtered = []
     found_numbers = set()
-    for pid in paper_ids:
-        note = client.get_note(pid)
+    for pid, note in zip(paper_ids, _get_notes(client, paper_ids)):
         if note.number in paper_numbers:
             filtered.append(pid)
             found_numbers.add(note.number)
@@ -233,6 +456,104 @@ def filter_paper_ids_by_number(client, paper_ids, paper_numbers):
     return filtered, unknown
 
 
+def _get_anon_groups(client, venue_id, number):
+    """
+    Fetch a submission's anonymous reviewer / AC / SAC groups in one request.
+
+    Returns {"Reviewer_": [...], "Area_Chair_": [...], "Senior_Area_Chair_": [...]},
+    each list in the order returned by the API.
+    """
+    prefix = f"{venue_id}/Submission{number}/"
+    buckets = {kind: [] for kind in _ANON_GROUP_KINDS}
+    for group in _call(client.get_groups, prefix=prefix):
+        name = group.id[len(prefix):]
+        for kind in _ANON_GROUP_KINDS:
+            if name.startswith(kind):
+                buckets[kind].append(group)
+                break
+    return buckets
+
+
+def _get_paper_thread(client, venue_id, note):
+    """Fetch a single paper's classified discussion thread, given its submission note."""
+    paper_id = note.id
+    title = _extract_content_value(note.content.get("title", "Unknown"))
+    authors = _extract_content_value(note.content.get("authors", []))
+    if isinstance(authors, list):
+        authors = ", ".join(authors)
+    abstract = _extract_content_value(note.content.get("abstract", ""))
+    number = note.number
+
+    # The forum and the anonymous groups are independent lookups; overlap them
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        forum_notes = executor.submit(_call, client.get_all_notes, forum=paper_id)
+        anon_groups = executor.submit(_get_anon_groups, client, venue_id, number)
+    all_notes = forum_notes.result()
+
+    # Build anonymous-to-signature label mapping
+    anon_groups = anon_groups.result()
+    # Map anon group ID to a short label like "Reviewer 1"
+    anon_label = {}
+    for i, ag in enumerate(anon_groups["Reviewer_"], 1):
+        anon_label[ag.id] = f"Reviewer {i}"
+    for ag in anon_groups["Area_Chair_"]:
+        anon_label[ag.id] = "Area Chair"
+    for ag in anon_groups["Senior_Area_Chair_"]:
+        anon_label[ag.id] = "Senior Area Chair"
+
+    # Classify notes
+    reviews = []
+    meta_reviews = []
+    decisions = []
+    comments = []
+
+    for n in all_notes:
+        if n.id == paper_id:
+            continue  # skip the submission itself
+        category = _classify_note(n)
+        if category is None:
+            continue
+
+        # Extract all content fields
+        content = {}
+        if hasattr(n, "content") and isinstance(n.content, dict):
+            for key, val in n.content.items():
+                content[key] = _extract_content_value(val)
+
+        # Resolve signature label
+        sig_labels = []
+        for sig in (n.signatures or []):
+            sig_labels.append(anon_label.get(sig, sig.rsplit("/", 1)[-1]))
+
+        entry = {
+            "id": n.id,
+            "content": content,
+            "signatures": sig_labels,
+            "replyto": n.replyto,
+        }
+
+        if category == "review":
+            reviews.append(entry)
+        elif category == "meta_review":
+            meta_reviews.append(entry)
+        elif category == "decision":
+            decisions.append(entry)
+        elif category == "comment":
+            comments.append(entry)
+
+    return {
+        "paper_id": paper_id,
+        "paper_number": number,
+        "title": title,
+        "authors": authors,
+        "abstract": abstract,
+        "reviews": reviews,
+        "meta_reviews": meta_reviews,
+        "decisions": decisions,
+        "comments": comments,
+    }
+
+
 def get_paper_reviews(client, venue_id, paper_ids):
     """
     Fetch the full discussion thread for each paper.
@@ -241,91 +562,129 @@ def get_paper_reviews(client, venue_id, paper_ids):
         paper_id, paper_number, title, authors, abstract,
         reviews, meta_reviews, decisions, comments
     """
-    results = []
-
-    for paper_id in paper_ids:
-        note = client.get_note(paper_id)
-        title = _extract_content_value(note.content.get("title", "Unknown"))
-        authors = _extract_content_value(note.content.get("authors", []))
-        if isinstance(authors, list):
-            authors = ", ".join(authors)
-        abstract = _extract_content_value(note.content.get("abstract", ""))
-        number = note.number
+    # Each paper needs several latency-bound API round trips, so papers are
+    # fetched concurrently; map() keeps the results in paper order.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        return list(executor.map(
+            lambda note: _get_paper_thread(client, venue_id, note),
+            _get_notes(client, paper_ids),
+        ))
 
-        all_notes = client.get_all_notes(forum=paper_id)
 
-        # Build anonymous-to-signature label mapping
-        anon_groups = client.get_groups(
-            prefix=f"{venue_id}/Submission{number}/Reviewer_"
+def _get_paper_non_responsive(client, venue_id, note):
+    """
+    Find the reviewers of a single paper (given its submission note) whose
+    review got an author response they haven't replied to. Returns a list
+    of entry dicts.
+    """
+    paper_id = note.id
+    title = note.content.get("title", {})
+    if isinstance(title, dict):
+        title = title.get("value", "Unknown")
+    number = note.number
+
+    all_notes = _call(client.get_all_notes, forum=paper_id)
+
+    # Map anonymous reviewer IDs <-> profile IDs
+    anon_groups = _call(
+        client.get_groups,
+        prefix=f"{venue_id}/Submission{number}/Reviewer_"
+    )
+    anon_to_profile = {}
+    profile_to_anon = {}
+    for ag in anon_groups:
+        if ag.members:
+            anon_to_profile[ag.id] = ag.members[0]
+            profile_to_anon[ag.members[0]] = ag.id
+
+    def _is_official_comment(n):
+        return any(i.endswith("/-/Official_Comment") for i in _get_note_invitations(n))
+
+    def _is_official_review(n):
+        return any(i.endswith(_REVIEW_SUFFIX) for i in _get_note_invitations(n))
+
+    def _signed_by_authors(n):
+        # Same test as re.search(r"(/|^)Authors$", sig)
+        return any(
+            sig == "Authors" or sig.endswith("/Authors") for sig in (n.signatures or [])
         )
-        # Map anon group ID to a short label like "Reviewer 1"
-        anon_label = {}
-        for i, ag in enumerate(anon_groups, 1):
-            anon_label[ag.id] = f"Reviewer {i}"
 
-        ac_anon_groups = client.get_groups(
-            prefix=f"{venue_id}/Submission{number}/Area_Chair_"
-        )
-        for ag in ac_anon_groups:
-            anon_label[ag.id] = "Area Chair"
+    def _subtree_notes(root_id):
+        """All notes in the subtree rooted at root_id (children, grandchildren, …)."""
+        found = []
+        queue = [root_id]
+        while queue:
+            current = queue.pop()
+            for child in children_of.get(current, []):
+                found.append(child)
+                queue.append(child.id)
+        return found
+
+    # One pass over the forum: build a parent -> [children] map for
+    # thread traversal, find each reviewer anon ID's review note, and
+    # collect replies signed by the authors
+    children_of = {}
+    review_note_by_anon = {}
+    author_replies = []
+    for n in all_notes:
+        parent = getattr(n, "replyto", None)
+        if parent:
+            children_of.setdefault(parent, []).append(n)
+            if _signed_by_authors(n) and _is_official_comment(n):
+                author_replies.append(n)
+        if _is_official_review(n):
+            for sig in (n.signatures or []):
+                if sig in anon_to_profile:
+                    review_note_by_anon[sig] = n
 
-        sac_anon_groups = client.get_groups(
-            prefix=f"{venue_id}/Submission{number}/Senior_Area_Chair_"
-        )
-        for ag in sac_anon_groups:
-            anon_label[ag.id] = "Senior Area Chair"
-
-        # Classify notes
-        reviews = []
-        meta_reviews = []
-        decisions = []
-        comments = []
-
-        for n in all_notes:
-            if n.id == paper_id:
-                continue  # skip the submission itself
-            category = _classify_note(n)
-            if category is None:
-                continue
+    if not review_note_by_anon:
+        return []  # no reviews submitted yet
 
-            # Extract all content fields
-            content = {}
-            if hasattr(n, "content") and isinstance(n.content, dict):
-                for key, val in n.content.items():
-                    content[key] = _extract_content_value(val)
+    # For each review, find the direct author-response comment (if any)
+    # An author response is an Official_Comment by Authors replying to the review note.
+    review_note_ids = {rn.id for rn in review_note_by_anon.values()}
+    author_response_id_for_review = {}  # review_note_id -> author response note id
+    for n in author_replies:
+        if n.replyto in review_note_ids:
+            author_response_id_for_review[n.replyto] = n.id
 
-            # Resolve signature label
-            sig_labels = []
-            for sig in (n.signatures or []):
-                sig_labels.append(anon_label.get(sig, sig.rsplit("/", 1)[-1]))
+    if not author_response_id_for_review:
+        return []  # no author responses posted yet
 
-            entry = {
-                "id": n.id,
-                "content": content,
-                "signatures": sig_labels,
-                "replyto": n.replyto,
-            }
+    # For each reviewer whose review got an author response, check whether
+    # the reviewer posted any Official_Comment in that response's subtree.
+    reviewer_edges = _call(
+        client.get_all_edges,
+        invitation=f"{venue_id}/Reviewers/-/Assignment",
+        head=paper_id,
+    )
+    assigned_reviewer_ids = [edge.tail for edge in reviewer_edges]
 
-            if category == "review":
-                reviews.append(entry)
-            elif category == "meta_review":
-                meta_reviews.append(entry)
-            elif category == "decision":
-                decisions.append(entry)
-            elif category == "comment":
-                comments.append(entry)
-
-        results.append({
-            "paper_id": paper_id,
-            "paper_number": number,
-            "title": title,
-            "authors": authors,
-            "abstract": abstract,
-            "reviews": reviews,
-            "meta_reviews": meta_reviews,
-            "decisions": decisions,
-            "comments": comments,
-        })
+    results = []
+    for rid in assigned_reviewer_ids:
+        anon_id = profile_to_anon.get(rid)
+        if not anon_id:
+            continue
+        review_note = review_note_by_anon.get(anon_id)
+        if not review_note:
+            continue  # reviewer has no review yet
+        author_response_id = author_response_id_for_review.get(review_note.id)
+        if not author_response_id:
+            continue  # no author response to this reviewer's review
+
+        # Check whether the reviewer replied anywhere in the author-response thread
+        replied = any(
+            anon_id in (n.signatures or []) and _is_official_comment(n)
+            for n in _subtree_notes(author_response_id)
+        )
+        if not replied:
+            results.append({
+                "paper_title": title,
+                "paper_number": number,
+                "paper_id": paper_id,
+                "reviewer_id": rid,
+                "reviewer_anon_id": anon_id,
+            })
 
     return results
 
@@ -342,121 +701,14 @@ def get_reviewers_without_response(client, venue_id, paper_ids):
     Returns list of dicts:
         {paper_title, paper_number, paper_id, reviewer_id, reviewer_anon_id}
     """
-    results = []
-
-    for paper_id in paper_ids:
-        note = client.get_note(paper_id)
-        title = note.content.get("title", {})
-        if isinstance(title, dict):
-            title = title.get("value", "Unknown")
-        number = note.number
-
-        all_notes = client.get_all_notes(forum=paper_id)
-
-        # Build a parent -> [children] map for thread traversal
-        children_of = {}
-        for n in all_notes:
-            parent = getattr(n, "replyto", None)
-            if parent:
-                children_of.setdefault(parent, []).append(n)
-
-        # Map anonymous reviewer IDs <-> profile IDs
-        anon_groups = client.get_groups(
-            prefix=f"{venue_id}/Submission{number}/Reviewer_"
-        )
-        anon_to_profile = {}
-        profile_to_anon = {}
-        for ag in anon_groups:
-            if ag.members:
-                anon_to_profile[ag.id] = ag.members[0]
-                profile_to_anon[ag.members[0]] = ag.id
-
-        def _is_official_comment(n):
-            inv = getattr(n, "invitation", None) or ""
-            invs = getattr(n, "invitations", None) or []
-            return any(re.search(r"/-/Official_Comment$", i) for i in invs + ([inv] if inv else []))
-
-        def _is_official_review(n):
-            inv = getattr(n, "invitation", None) or ""
-            invs = getattr(n, "invitations", None) or []
-            return any(re.search(r"/-/Official_Review$", i) for i in invs + ([inv] if inv else []))
-
-        def _signed_by_authors(n):
-            return any(re.search(r"(/|^)Authors$", sig) for sig in (n.signatures or []))
-
-        def _subtree_notes(root_id):
-            """All notes in the subtree rooted at root_id (children, grandchildren, …)."""
-            found = []
-            queue = [root_id]
-            while queue:
-                current = queue.pop()
-                for child in children_of.get(current, []):
-                    found.append(child)
-                    queue.append(child.id)
-            return found
-
-        # For each reviewer anon ID: find their review note
-        review_note_by_anon = {}
-        for n in all_notes:
-            if not _is_official_review(n):
-                continue
-            for sig in (n.signatures or []):
-                if sig in anon_to_profile:
-                    review_note_by_anon[sig] = n
-
-        if not review_note_by_anon:
-            continue  # no reviews submitted yet
-
-        # For each review, find the direct author-response comment (if any)
-        # An author response is an Official_Comment by Authors replying to the review note.
-        author_response_id_for_review = {}  # review_note_id -> author response note id
-        for n in all_notes:
-            if not _is_official_comment(n):
-                continue
-            if not _signed_by_authors(n):
-                continue
-            replyto = getattr(n, "replyto", None)
-            review_note_ids = {rn.id for rn in review_note_by_anon.values()}
-            if replyto in review_note_ids:
-                author_response_id_for_review[replyto] = n.id
-
-        if not author_response_id_for_review:
-            continue  # no author responses posted yet
-
-        # For each reviewer whose review got an author response, check whether
-        # the reviewer posted any Official_Comment in that response's subtree.
-        reviewer_edges = client.get_all_edges(
-            invitation=f"{venue_id}/Reviewers/-/Assignment",
-            head=paper_id,
+    # Each paper needs several latency-bound API round trips, so papers are
+    # fetched concurrently; map() keeps the results in paper order.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        per_paper = executor.map(
+            lambda note: _get_paper_non_responsive(client, venue_id, note),
+            _get_notes(client, paper_ids),
         )
-        assigned_reviewer_ids = [edge.tail for edge in reviewer_edges]
-
-        for rid in assigned_reviewer_ids:
-            anon_id = profile_to_anon.get(rid)
-            if not anon_id:
-                continue
-            review_note = review_note_by_anon.get(anon_id)
-            if not review_note:
-                continue  # reviewer has no review yet
-            author_response_id = author_response_id_for_review.get(review_note.id)
-            if not author_response_id:
-                continue  # no author response to this reviewer's review
-
-            # Check whether the reviewer replied anywhere in the author-response thread
-            replied = any(
-                anon_id in (n.signatures or []) and _is_official_comment(n)
-                for n in _subtree_notes(author_response_id)
-            )
-            if not replied:
-                results.append({
-                    "paper_title": title,
-                    "paper_number": number,
-                    "paper_id": paper_id,
-                    "reviewer_id": rid,
-                    "reviewer_anon_id": anon_id,
-                })
-
-    return results
+        return [entry for entries in per_paper for entry in entries]
 
 
 def post_reviewer_rebuttal_comment(client, venue_id, paper_id, paper_number, user_id, reviewer_anon_ids):
@@ -469,10 +721,9 @@ def post_reviewer_rebuttal_comment(client, venue_id, paper_id, paper_number, use
     Returns (paper_number, True) on success or
             (paper_number, False, error_msg) on failure.
     """
+    submission = f"{venue_id}/Submission{paper_number}"
     try:
-        anon_groups = client.get_groups(
-            prefix=f"{venue_id}/Submission{paper_number}/Area_Chair_"
-        )
+        anon_groups = _call(client.get_groups, prefix=f"{submission}/Area_Chair_")
         ac_anon_id = None
         for ag in anon_groups:
             if ag.members and user_id in ag.members:
@@ -488,12 +739,12 @@ def post_reviewer_rebuttal_comment(client, venue_id, paper_id, paper_number, use
 
         readers = [
             f"{venue_id}/Program_Chairs",
-            f"{venue_id}/Submission{paper_number}/Senior_Area_Chairs",
-            f"{venue_id}/Submission{paper_number}/Area_Chairs",
+            f"{submission}/Senior_Area_Chairs",
+            f"{submission}/Area_Chairs",
         ] + list(reviewer_anon_ids)
 
         client.post_note_edit(
-            invitation=f"{venue_id}/Submission{paper_number}/-/Official_Comment",
+            invitation=f"{submission}/-/Official_Comment",
             signatures=[ac_anon_id],
             note=openreview.api.Note(
                 forum=paper_id,
@@ -511,133 +762,177 @@ def post_reviewer_rebuttal_comment(client, venue_id, paper_id, paper_number, use
         return (paper_number, False, str(e))
 
 
-def get_missing_reviews(client, venue_id, paper_ids):
+def _compute_missing(note, assigned_reviewer_ids, review_notes, emergency_notes, anon_groups):
     """
-    For each paper, find reviewers who haven't submitted reviews.
+    Work out which assigned reviewers of a paper haven't submitted a review,
+    from already-fetched data (no API calls).
 
-    Returns list of dicts:
-        {paper_title, paper_number, paper_id, reviewer_email, reviewer_id}
+    note is the submission note; review_notes / emergency_notes are its
+    Official_Review and Emergency_Declaration notes; anon_groups are its
+    Reviewer_ anonymous groups. Returns a list of entry dicts without
+    email/name filled in, in assigned_reviewer_ids order.
     """
-    results = []
-    all_missing_reviewer_ids = []
-
-    paper_missing = []
-    for paper_id in paper_ids:
-        note = client.get_note(paper_id)
-        title = note.content.get("title", {})
-        if isinstance(title, dict):
-            title = title.get("value", "Unknown")
-        number = note.number
-
-        # Get reviewer assignments
-        reviewer_edges = client.get_all_edges(
-            invitation=f"{venue_id}/Reviewers/-/Assignment",
-            head=paper_id,
+    title = note.content.get("title", {})
+    if isinstance(title, dict):
+        title = title.get("value", "Unknown")
+
+    # Map anonymous reviewer IDs to profile IDs
+    # Reviews are signed with anonymous IDs like venue/Submission123/Reviewer_abc
+    anon_to_profile = {ag.id: ag.members[0] for ag in anon_groups if ag.members}
+
+    # Find which profile IDs have submitted reviews / declared an emergency
+    reviewed_profiles = {
+        anon_to_profile[sig]
+        for n in review_notes for sig in (n.signatures or [])
+        if sig in anon_to_profile
+    }
+    emergency_profiles = {
+        anon_to_profile[sig]
+        for n in emergency_notes for sig in (n.signatures or [])
+        if sig in anon_to_profile
+    }
+
+    # Find missing reviewers
+    return [
+        {
+            "paper_title": title,
+            "paper_number": note.number,
+            "paper_id": note.id,
+            "reviewer_id": rid,
+            "flag": "Emergency" if rid in emergency_profiles else "",
+        }
+        for rid in assigned_reviewer_ids
+        if rid not in reviewed_profiles
+    ]
+
+
+def _get_paper_missing_reviews(client, venue_id, note):
+    """
+    Find the assigned reviewers of a single paper (given its submission
+    note) who haven't submitted a review. Fetches the paper's assignments,
+    reviews and anonymous groups, then defers to _compute_missing.
+    """
+    paper_id = note.id
+    number = note.number
+
+    # Get reviewer assignments
+    reviewer_edges = _call(
+        client.get_all_edges,
+        invitation=f"{venue_id}/Reviewers/-/Assignment",
+        head=paper_id,
+    )
+    assigned_reviewer_ids = [edge.tail for edge in reviewer_edges]
+    if not assigned_reviewer_ids:
+        return []  # nobody can be missing; skip the forum and group lookups
+
+    # Get submitted reviews and emergency declarations — let the API filter
+    # by invitation so the rest of the forum (comments, rebuttals, revisions)
+    # is never transferred — plus the anonymous reviewer groups. The three
+    # requests are independent, so their round trips overlap.
+    invitation_prefix = f"{venue_id}/Submission{number}"
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        review_notes = executor.submit(
+            _call, client.get_all_notes,
+            forum=paper_id, invitation=invitation_prefix + _REVIEW_SUFFIX,
         )
-        assigned_reviewer_ids = [edge.tail for edge in reviewer_edges]
-
-        # Get submitted reviews — fetch all notes for the forum and filter
-        # API v2 uses 'invitations' (list) instead of 'invitation' (string)
-        all_notes = client.get_all_notes(forum=paper_id)
-        review_notes = []
-        for n in all_notes:
-            inv = getattr(n, "invitation", None) or ""
-            invs = getattr(n, "invitations", None) or []
-            all_invs = invs + ([inv] if inv else [])
-            if any(
-                re.search(r"/-/Official_Review$", i) for i in all_invs
-            ):
-                review_notes.append(n)
-
-        # Map anonymous reviewer IDs to profile IDs
-        # Reviews are signed with anonymous IDs like venue/Submission123/Reviewer_abc
-        anon_groups = client.get_groups(
-            prefix=f"{venue_id}/Submission{number}/Reviewer_"
+        emergency_notes = executor.submit(
+            _call, client.get_all_notes,
+            forum=paper_id, invitation=invitation_prefix + _EMERGENCY_SUFFIX,
+        )
+        anon_groups = executor.submit(
+            _call, client.get_groups, prefix=f"{invitation_prefix}/Reviewer_"
         )
-        anon_to_profile = {}
-        for ag in anon_groups:
-            if ag.members:
-                anon_to_profile[ag.id] = ag.members[0]
-
-        # Find emergency declarations
-        emergency_profiles = set()
-        for n in all_notes:
-            inv = getattr(n, "invitation", None) or ""
-            invs = getattr(n, "invitations", None) or []
-            all_invs = invs + ([inv] if inv else [])
-            if any(
-                re.search(r"/-/Emergency_Declaration$", i) for i in all_invs
-            ):
-                for sig in n.signatures:
-                    if sig in anon_to_profile:
-                        emergency_profiles.add(anon_to_profile[sig])
-
-        # Find which profile IDs have submitted reviews
-        reviewed_profiles = set()
-        for review in review_notes:
-            for sig in review.signatures:
-                if sig in anon_to_profile:
-                    reviewed_profiles.add(anon_to_profile[sig])
 
-        # Find missing reviewers
-        missing_ids = [
-            rid for rid in assigned_reviewer_ids if rid not in reviewed_profiles
-        ]
+    return _compute_missing(
+        note,
+        assigned_reviewer_ids,
+        review_notes.result(),
+        emergency_notes.result(),
+        anon_groups.result(),
+    )
 
-        for rid in missing_ids:
-            paper_missing.append(
-                {
-                    "paper_title": title,
-                    "paper_number": number,
-                    "paper_id": paper_id,
-                    "reviewer_id": rid,
-                    "flag": "Emergency" if rid in emergency_profiles else "",
-                }
-            )
-            all_missing_reviewer_ids.append(rid)
+
+def _profile_cache_key(venue_id, profile_id):
+    """Filesystem-safe cache key for a reviewer's profile in a venue."""
+    digest = hashlib.sha256(f"{venue_id}\n{profile_id}".encode("utf-8")).hexdigest()
+    return f"profile-{digest}"
+
+
+def get_missing_reviews(client, venue_id, paper_ids, profile_cache=None, refresh_profiles=False):
+    """
+    For each paper, find reviewers who haven't submitted reviews.
+
+    If profile_cache (a service.cache.ResultCache) is given, reviewer emails
+    and names resolved within PROFILE_CACHE_TTL are reused instead of being
+    fetched again; refresh_profiles ignores the cached entries (they are
+    still rewritten).
+
+    Returns list of dicts:
+        {paper_title, paper_number, paper_id, reviewer_email, reviewer_id}
+    """
+    # Each paper needs several latency-bound API round trips, so papers are
+    # fetched concurrently; map() keeps the results in paper order.
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        per_paper = executor.map(
+            lambda note: _get_paper_missing_reviews(client, venue_id, note),
+            _get_notes(client, paper_ids),
+        )
+        paper_missing = [entry for entries in per_paper for entry in entries]
+    # Unique missing reviewer IDs, in first-seen order
+    all_missing_reviewer_ids = list(dict.fromkeys(entry["reviewer_id"] for entry in paper_missing))
 
     # Batch-fetch profiles for all missing reviewer IDs
     email_map = {}
     name_map = {}
-    if all_missing_reviewer_ids:
-        unique_ids = list(set(all_missing_reviewer_ids))
 
+    # Reuse (email, name) pairs resolved by recent runs
+    cached_ids = set()
+    if profile_cache is not None and not refresh_profiles:
+        for rid in all_missing_reviewer_ids:
+            cached = profile_cache.get(
+                _profile_cache_key(venue_id, rid), max_age=PROFILE_CACHE_TTL
+            )
+            if cached is not None and "email" in cached:
+                email_map[rid] = cached["email"]
+                name_map[rid] = cached.get("name", rid)
+                cached_ids.add(rid)
+
+    unique_ids = [rid for rid in all_missing_reviewer_ids if rid not in cached_ids]
+    if unique_ids:
         # Try fetching profiles with preferred emails from venue edges
         try:
-            profiles = openreview.tools.get_profiles(
+            profiles = _call(
+                openreview.tools.get_profiles,
                 client, unique_ids,
                 with_preferred_emails=f"{venue_id}/-/Preferred_Emails",
             )
         except Exception:
-            profiles = openreview.tools.get_profiles(client, unique_ids)
+            profiles = _call(openreview.tools.get_profiles, client, unique_ids)
 
         needs_individual_fetch = []
         for profile in profiles:
             email = _get_profile_email(profile)
-            name = None
-            if hasattr(profile, "content") and isinstance(profile.content, dict):
-                names = profile.content.get("names", [])
-                if names:
-                    n = names[0]
-                    if isinstance(n, dict):
-                        first = n.get("first", "")
-                        last = n.get("last", "")
-                        name = f"{first} {last}".strip()
+            name = _get_profile_name(profile)
             if not email:
                 needs_individual_fetch.append(profile.id)
             email_map[profile.id] = email or profile.id
             name_map[profile.id] = name or profile.id
 
         # For profiles without emails, try individual fetch (may return
-        # fuller data for authenticated ACs)
-        for pid in needs_individual_fetch:
+        # fuller data for authenticated ACs); these are independent
+        # requests, so they run concurrently
+        def _fetch_profile_email(pid):
             try:
-                full_profile = client.get_profile(pid)
-                email = _get_profile_email(full_profile)
-                if email:
-                    email_map[pid] = email
+                return _get_profile_email(_call(client.get_profile, pid))
             except Exception:
-                pass
+                return None
+
+        if needs_individual_fetch:
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+                emails = executor.map(_fetch_profile_email, needs_individual_fetch)
+                for pid, email in zip(needs_individual_fetch, emails):
+                    if email:
+                        email_map[pid] = email
 
         # Map original input IDs that are emails (keys above are tilde IDs)
         for uid in unique_ids:
@@ -645,12 +940,22 @@ def get_missing_reviews(client, venue_id, paper_ids):
                 email_map[uid] = uid
                 name_map[uid] = uid
 
+        # Only cache real addresses, so unresolved profiles are retried
+        if profile_cache is not None:
+            for uid in unique_ids:
+                email = email_map.get(uid)
+                if email and "@" in email:
+                    profile_cache.set(
+                        _profile_cache_key(venue_id, uid),
+                        {"email": email, "name": name_map.get(uid, uid)},
+                    )
+
+    # Fill in contact details in place; the entries are the results
     for entry in paper_missing:
         rid = entry["reviewer_id"]
         entry["reviewer_email"] = email_map.get(rid, rid)
         entry["reviewer_name"] = name_map.get(rid, rid)
-        results.append(entry)
 
-    return results
+    return paper_missing
 
 
@@ -4,19 +4,26 @@ PDF checker module for validating academic paper submissions.
 
 import re
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 
-import pdfplumber
-import PyPDF2
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich.progress import Progress, TextColumn, BarColumn, MofNCompleteColumn, TimeElapsedColumn
 
+from . import __version__
+from .cache import ResultCache, file_sha256
+
+# Part of every result cache key. Bump it in any change that alters what the
+# checks report for the same PDF, so results cached by older code are ignored.
+CHECKS_VERSION = 2
+
 
 class PaperType(Enum):
     SHORT = "short"
@@ -49,6 +56,25 @@ class Issue:
             IssueType.ETHICAL_CONSIDERATIONS: "ETH"
         }
         return code_map.get(self.issue_type, "UNK")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "issue_type": self.issue_type.value,
+            "severity": self.severity,
+            "message": self.message,
+            "details": self.details,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Issue":
+        """Rebuild an Issue from to_dict() output."""
+        return cls(
+            issue_type=IssueType(data["issue_type"]),
+            severity=data["severity"],
+            message=data["message"],
+            details=data.get("details"),
+        )
 
 
 @dataclass
@@ -67,62 +93,92 @@ class PDFCheckResult:
     @property
     def has_warnings(self) -> bool:
         return any(issue.severity == "warning" for issue in self.issues)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return {
+            "file_path": self.file_path,
+            "paper_type": self.paper_type.value,
+            "total_pages": self.total_pages,
+            "content_pages": self.content_pages,
+            "issues": [issue.to_dict() for issue in self.issues],
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PDFCheckResult":
+        """Rebuild a PDFCheckResult from to_dict() output."""
+        return cls(
+            file_path=data["file_path"],
+            paper_type=PaperType(data["paper_type"]),
+            total_pages=data["total_pages"],
+            content_pages=data["content_pages"],
+            issues=[Issue.from_dict(issue) for issue in data["issues"]],
+        )
+
+
+def find_pdfs(directory: Union[str, Path], recursive: bool = False) -> List[Path]:
+    """Return the PDF files in a directory (and its subdirectories if recursive), sorted."""
+    directory = Path(directory)
+    return sorted(directory.rglob("*.pdf") if recursive else directory.glob("*.pdf"))
 
 
 class PDFChecker:
     """Main class for checking PDF submissions against academic requirements."""
     
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(
+        self,
+        console: Optional[Console] = None,
+        cache: Optional[ResultCache] = None,
+        checks: Optional[Iterable[IssueType]] = None,
+    ):
         self.console = console or Console()
-        
-        # Single comprehensive regex for all section detection
+        # Results of previously checked files, keyed by content (None: disabled)
+        self.cache = cache
+        # Checks to run (default: all); the others are skipped entirely
+        self.checks = frozenset(IssueType if checks is None else checks)
+        
+        # Single comprehensive regex for all section detection. Alternatives
+        # are grouped under a shared line-start or word-boundary anchor so
+        # most positions are rejected before any keyword branch is tried
         self.section_patterns = re.compile(
+            r'^\s*(?:'
+            # Section headings on a line of their own, optionally numbered:
+            # "Limitations", "5. Ethical Considerations", "Appendix A", ...
+            r'\d*\.?\s*(?:'
+            r'limitations?|ethical?\s+considerations?|ethicalconsiderations?|ethics?|'
+            r'references?|bibliography|appendix\s*[a-z]?|appendices'
+            r')\s*$|'
+            r'[a-z]\)?\s*limitations?\s*$|'                      # "a) Limitations"
+            r'[ivxlcdm]+\.?\s*limitations?\s*$|'                 # "iv. Limitations"
+            r'limitations?\s+|'                                  # "Limitations " (more flexible)
+            r'\d{1,4}\s+ethicalconsiderations?\s+|'              # "588 EthicalConsiderations "
+            r'appendix\s*[a-z]?\s*:|'                            # "Appendix A:"
+            r'\[1\]|'                                            # "[1]" - start of references
+            r'1\.\s+[A-Z]'                                       # "1. Author" - numbered references
+            r')|'
+            r'\b(?:'
+            # Headings found anywhere on the line (e.g. after line numbers)
+            r'\d{1,4}\s+(?:limitations?|ethical?\s+considerations?|references?)\b|'  # "592 Limitations"
             r'(?:'
-            # Limitations patterns - handle various numbering schemes and positions
-            r'^\s*\d*\.?\s*limitations?\s*$|'                    # "Limitations", "5. Limitations" (exact match)
-            r'^\s*[a-z]\)?\s*limitations?\s*$|'                  # "a) Limitations" (exact match)
-            r'^\s*[ivxlcdm]+\.?\s*limitations?\s*$|'             # "iv. Limitations" (exact match)
-            r'^\s*\d{1,3}\.\s*limitations?\s*$|'                 # "5. Limitations" (section number with dot)
-            r'^\s*\d{1,3}\s+limitations?\s*$|'                   # "5 Limitations" (section number without dot)
-            r'^\s*limitations?\s+|'                              # "Limitations " (at start of line, more flexible)
-            r'\b\d{1,4}\s+limitations?\b|'                       # "592 Limitations" (anywhere, not necessarily end of line)
-            r'\blimitations?\s*$|'                               # "Limitations" (end of line, standalone)
-            
-            # Ethical considerations patterns - handle various formats
-            r'^\s*\d*\.?\s*ethical?\s+considerations?\s*$|'      # "Ethical Considerations", "5. Ethical Considerations" (exact match)
-            r'^\s*\d*\.?\s*ethicalconsiderations?\s*$|'          # "EthicalConsiderations" (one word, exact match)
-            r'^\s*\d{1,4}\s+ethicalconsiderations?\s+|'          # "588 EthicalConsiderations " (number + one word, flexible)
-            r'^\s*\d*\.?\s*ethics?\s*$|'                         # "Ethics", "5. Ethics" (exact match)
-            r'^\s*\d{1,3}\.\s*ethical?\s+considerations?\s*$|'   # "5. Ethical Considerations" (section number with dot)
-            r'^\s*\d{1,3}\s+ethical?\s+considerations?\s*$|'     # "5 Ethical Considerations" (section number without dot)
-            r'\b\d{1,4}\s+ethical?\s+considerations?\b|'         # "592 Ethical Considerations" (anywhere)
-            r'\bethical?\s+considerations?\s*$|'                 # "Ethical Considerations" (end of line, standalone)
-            r'\bethicalconsiderations?\s*$|'                     # "EthicalConsiderations" (one word, end of line)
-            r'\bethics?\s*$|'                                    # "Ethics" (end of line, standalone)
-            
-            # References patterns - handle various formats
-            r'^\s*\d*\.?\s*references?\s*$|'                     # "References", "5. References" (exact match)
-            r'^\s*\d*\.?\s*bibliography\s*$|'                    # "Bibliography", "5. Bibliography" (exact match)
-            r'^\s*\d{1,3}\.\s*references?\s*$|'                  # "5. References" (section number with dot)
-            r'^\s*\d{1,3}\s+references?\s*$|'                    # "5 References" (section number without dot)
-            r'\b\d{1,4}\s+references?\b|'                        # "588 References" (number + references anywhere)
-            r'\breferences?\s+\d{3,4}\s*$|'                      # "References 639" (with line numbers)
-            r'\breferences?\s*$|'                                # "References" (end of line, standalone)
-            r'^\s*\[1\]|'                                        # "[1]" - start of references
-            r'^\s*1\.\s+[A-Z]|'                                  # "1. Author" - numbered references
-            
-            # Appendix patterns - handle various formats
-            r'^\s*\d*\.?\s*appendix\s*[a-z]?\s*$|'              # "Appendix", "Appendix A" (exact match)
-            r'^\s*\d*\.?\s*appendices\s*$|'                     # "Appendices" (exact match)
-            r'^\s*\d{1,3}\.\s*appendix\s*[a-z]?\s*$|'          # "A.1 Appendix" (section number with dot)
-            r'^\s*\d{1,3}\s+appendix\s*[a-z]?\s*$|'            # "A1 Appendix" (section number without dot)
-            r'^\s*appendix\s*[a-z]?\s*:|'                       # "Appendix A:" (with colon)
-            r'\bsupplementary\s+materials?\s*$|'                # "Supplementary materials" (end of line)
-            r'\badditional\s+results\s*$'                       # "Additional results" (end of line)
+            r'limitations?|ethical?\s+considerations?|ethicalconsiderations?|ethics?|'
+            r'references?|supplementary\s+materials?|additional\s+results'
+            r')\s*$|'                                            # "... Limitations" (end of line)
+            r'references?\s+\d{3,4}\s*$'                         # "References 639"
             r')',
             re.IGNORECASE | re.MULTILINE
         )
         
+        # Literal text (lowercase) of which every keyword branch of
+        # section_patterns needs one; on pages with none of it, only the
+        # "[1]" / "1. Author" branches, which need no keyword, can match
+        self.section_keywords = (
+            "limitation", "ethic", "reference", "bibliography", "appendi",
+            "supplementary", "additional",
+        )
+        
+        # Lines that mention a limitation (candidates for the section check)
+        self.limitation_lines = re.compile(r'^.*limitation.*$', re.IGNORECASE | re.MULTILINE)
+        
         # Anonymization patterns (kept separate as they're different purpose)
         self.anonymization_patterns = [
             r'\b[A-Z][a-z]+ University\b',
@@ -133,6 +189,64 @@ class PDFChecker:
             r'\b(?:Affiliation|Department):\s*[A-Z]',
             r'\{[a-z]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\}',  # LaTeX emails
         ]
+        
+        # Literal text (lowercase) that each anonymization pattern needs in
+        # order to match; a pattern is skipped when none of it is present
+        self.anonymization_keywords = [
+            ("university",),
+            ("institute",),
+            ("college",),
+            ("@",),
+            ("author",),
+            ("affiliation", "department"),
+            ("@",),
+        ]
+        self.anonymization_regexes = [
+            re.compile(pattern, re.IGNORECASE) for pattern in self.anonymization_patterns
+        ]
+        
+        # Reference-list line shapes
+        self.first_numbered_reference = re.compile(r'^\s*1\.\s+[A-Z]')  # "1. Author"
+        self.numbered_reference = re.compile(r'^\s*\d+\.\s+[A-Z]')     # "12. Author"
+        self.bracket_reference = re.compile(r'^\s*\[\d+\]')            # "[12]"
+        # Any of the above, in one pass per line
+        self.reference_line = re.compile(
+            r'^\s*(?:'
+            r'\[\d+\]|'                                 # [12]
+            r'\d+\.\s+[A-Z]|'                            # 12. Author
+            r'[A-Z][^.]*\.\s*\([12]\d{3}\)|'               # Author (year)
+            r'[A-Z][^.]*\.\s+[A-Z][^.]*\.\s+\([12]\d{3}\)'  # Author. Title. (year)
+            r')'
+        )
+        
+        # Appendix content indicators (matched against lowercased page text);
+        # one group per indicator so a single scan can tell which were seen
+        self.appendix_indicators = re.compile(
+            r'\b(?:(appendix)|(supplementary)|(additional\s+results)|(detailed\s+proofs))\b'
+        )
+        
+        # ?? patterns that typically indicate broken references
+        self.broken_ref_patterns = [
+            re.compile(r'\?\?', re.IGNORECASE),          # Double question marks
+            re.compile(r'\[.*\?\?.*\]', re.IGNORECASE),  # Question marks inside brackets like [??]
+            re.compile(r'\(.*\?\?.*\)', re.IGNORECASE),  # Question marks inside parentheses like (??)
+        ]
+        
+        # Ethical considerations section headers
+        self.ethical_patterns = [
+            re.compile(pattern, re.IGNORECASE | re.MULTILINE) for pattern in [
+                r'^\s*\d*\.?\s*ethical?\s+considerations?\s*$',      # "Ethical Considerations", "5. Ethical Considerations"
+                r'^\s*\d*\.?\s*ethicalconsiderations?\s*$',          # "EthicalConsiderations" (one word, exact match)
+                r'^\s*\d{1,4}\s+ethicalconsiderations?\s+',          # "588 EthicalConsiderations " (number + one word, flexible)
+                r'^\s*\d*\.?\s*ethics?\s*$',                         # "Ethics", "5. Ethics"
+                r'^\s*\d{1,3}\.\s*ethical?\s+considerations?\s*$',   # "5. Ethical Considerations"
+                r'^\s*\d{1,3}\s+ethical?\s+considerations?\s*$',     # "5 Ethical Considerations"
+                r'\b\d{1,4}\s+ethical?\s+considerations?\b',         # "592 Ethical Considerations"
+                r'\bethical?\s+considerations?\s*$',                 # "Ethical Considerations" (end of line)
+                r'\bethicalconsiderations?\s*$',                     # "EthicalConsiderations" (one word, end of line)
+                r'\bethics?\s*$',                                    # "Ethics" (end of line)
+            ]
+        ]
     
     def check_pdf(self, file_path: str, paper_type: PaperType) -> PDFCheckResult:
         """
@@ -145,51 +259,118 @@ class PDFChecker:
         Returns:
             PDFCheckResult with all issues found
         """
-        issues = []
-        
+        cache_key = self._cache_key(file_path, paper_type)
+        cached = self._load_cached(cache_key, file_path)
+        if cached is not None:
+            return cached
+        
+        result = self._run_checks(file_path, paper_type)
+        self._store_cached(cache_key, result)
+        return result
+    
+    def _cache_key(self, file_path: str, paper_type: PaperType) -> Optional[str]:
+        """
+        Cache key for a file: its content hash, the paper type, the package
+        version and CHECKS_VERSION (so results are recomputed when the checks
+        change), plus the enabled checks when some are skipped. None if caching is disabled or the file
+        can't be read.
+        """
+        if self.cache is None:
+            return None
         try:
-            with pdfplumber.open(file_path) as pdf:
-                total_pages = len(pdf.pages)
-                
-                # Extract text from all pages for analysis
-                full_text = ""
-                page_texts = []
-                for page in pdf.pages:
-                    page_text = page.extract_text() or ""
-                    page_texts.append(page_text)
-                    full_text += page_text + "\n"
-                
-                # Calculate content pages (excluding references, etc.)
-                content_pages = self._calculate_content_pages(page_texts)
-                
-                # Check page limits
-                page_limit_issues = self._check_page_limits(content_pages, paper_type)
-                issues.extend(page_limit_issues)
-                
-                # Check for limitations section
-                limitations_issues = self._check_limitations_section(full_text)
-                issues.extend(limitations_issues)
-                
-                # Check anonymization
-                anonymization_issues = self._check_anonymization(full_text)
-                issues.extend(anonymization_issues)
-                
-                # Check for broken references
-                broken_ref_issues = self._check_broken_references(full_text)
-                issues.extend(broken_ref_issues)
-                
-                # Check for ethical considerations section
-                ethical_issues = self._check_ethical_considerations(full_text)
-                issues.extend(ethical_issues)
-                
+            digest = file_sha256(file_path)
+        except OSError:
+            return None
+        key = f"{digest}-{paper_type.value}-{__version__}-{CHECKS_VERSION}"
+        if self.checks != frozenset(IssueType):
+            key += "-" + ",".join(sorted(check.value for check in self.checks))
+        return key
+    
+    def _load_cached(self, cache_key: Optional[str], file_path: str) -> Optional[PDFCheckResult]:
+        """Return the cached result for cache_key, reported under file_path."""
+        if cache_key is None:
+            return None
+        data = self.cache.get(cache_key)
+        if data is None:
+            return None
+        try:
+            result = PDFCheckResult.from_dict(data)
+        except (KeyError, TypeError, ValueError):
+            return None
+        # The same content may have been checked under another name
+        result.file_path = file_path
+        return result
+    
+    def _store_cached(self, cache_key: Optional[str], result: PDFCheckResult) -> None:
+        """Cache a result, unless the PDF could not be processed at all."""
+        if cache_key is None or result.total_pages == 0:
+            return
+        self.cache.set(cache_key, result.to_dict())
+    
+    def _run_checks(self, file_path: str, paper_type: PaperType) -> PDFCheckResult:
+        """Run every check on a PDF (check_pdf without the cache)."""
+        try:
+            # Extract text from all pages once; every check reuses it
+            page_texts = self._extract_page_texts(file_path)
+            return self._analyze(file_path, page_texts, paper_type)
         except Exception as e:
-            issues.append(Issue(
-                issue_type=IssueType.PAGE_LIMIT,
-                severity="error",
-                message=f"Failed to process PDF: {str(e)}"
-            ))
-            total_pages = 0
-            content_pages = 0
+            return PDFCheckResult(
+                file_path=file_path,
+                paper_type=paper_type,
+                total_pages=0,
+                content_pages=0,
+                issues=[Issue(
+                    issue_type=IssueType.PAGE_LIMIT,
+                    severity="error",
+                    message=f"Failed to process PDF: {str(e)}"
+                )]
+            )
+    
+    def _analyze(self, file_path: str, page_texts: List[str], paper_type: PaperType) -> PDFCheckResult:
+        """
+        Run the enabled checks on already extracted page texts.
+        
+        Args:
+            file_path: Path the result is reported under
+            page_texts: Text of each page, as returned by _extract_page_texts
+            paper_type: Type of paper (SHORT or LONG)
+            
+        Returns:
+            PDFCheckResult with all issues found
+        """
+        issues = []
+        total_pages = len(page_texts)
+        
+        # Each page is newline-terminated, as the text checks expect
+        full_text = "".join(page_text + "\n" for page_text in page_texts)
+        
+        # Calculate content pages (excluding references, etc.)
+        content_pages = self._calculate_content_pages(page_texts)
+        
+        # Check page limits
+        if IssueType.PAGE_LIMIT in self.checks:
+            page_limit_issues = self._check_page_limits(content_pages, paper_type)
+            issues.extend(page_limit_issues)
+        
+        # Check for limitations section
+        if IssueType.MISSING_LIMITATIONS in self.checks:
+            limitations_issues = self._check_limitations_section(full_text)
+            issues.extend(limitations_issues)
+        
+        # Check anonymization
+        if IssueType.ANONYMIZATION in self.checks:
+            anonymization_issues = self._check_anonymization(full_text)
+            issues.extend(anonymization_issues)
+        
+        # Check for broken references
+        if IssueType.BROKEN_REFERENCES in self.checks:
+            broken_ref_issues = self._check_broken_references(full_text)
+            issues.extend(broken_ref_issues)
+        
+        # Check for ethical considerations section
+        if IssueType.ETHICAL_CONSIDERATIONS in self.checks:
+            ethical_issues = self._check_ethical_considerations(full_text)
+            issues.extend(ethical_issues)
         
         return PDFCheckResult(
             file_path=file_path,
@@ -199,6 +380,27 @@ class PDFChecker:
             issues=issues
         )
     
+    def _extract_page_texts(self, file_path: str) -> List[str]:
+        """
+        Extract the text of every page in a single pass over the PDF.
+        
+        Layout analysis is the expensive part of a check, so the PDF is opened
+        once and each page is extracted exactly once; the page-limit, section,
+        anonymization and reference checks all work off this list. Each
+        page's parsed objects are released as soon as its text is out, so
+        memory peaks at one page's layout rather than the whole document's.
+        """
+        # Imported here so loading the result types (the CLI, cached or
+        # saved results) doesn't pull in the PDF parser
+        import pdfplumber
+        
+        page_texts = []
+        with pdfplumber.open(file_path) as pdf:
+            for page in pdf.pages:
+                page_texts.append(page.extract_text() or "")
+                page.close()
+        return page_texts
+    
     def _calculate_content_pages(self, page_texts: List[str]) -> int:
         """
         Calculate the number of content pages, excluding references, appendices, 
@@ -210,8 +412,12 @@ class PDFChecker:
         if not page_texts:
             return 0
         
+        # Split every page into stripped, non-empty lines once; both passes
+        # below work off these
+        page_lines = [self._page_lines(page_text) for page_text in page_texts]
+        
         # Try to find where limitations/references start (can be mid-page)
-        content_end = self._find_main_content_end(page_texts)
+        content_end = self._find_main_content_end(page_lines)
         
         if content_end is not None:
             # If limitations/references start mid-page, count that page as content
@@ -224,26 +430,36 @@ class PDFChecker:
         
         # Fallback: analyze each page individually
         content_pages = 0
-        for i, page_text in enumerate(page_texts):
-            if not self._page_is_excluded_content(page_text, i):
+        for page_text, lines in zip(page_texts, page_lines):
+            if not self._page_is_excluded_content(page_text, lines):
                 content_pages += 1
         
         # Ensure we have at least 1 content page (sanity check)
         return max(1, content_pages)
     
-    def _find_main_content_end(self, page_texts: List[str]) -> tuple:
+    @staticmethod
+    def _page_lines(page_text: str) -> List[str]:
+        """The stripped, non-empty lines of a page."""
+        return [line for line in (raw.strip() for raw in page_text.split('\n')) if line]
+    
+    def _find_main_content_end(self, page_lines: List[List[str]]) -> tuple:
         """
         Find where main content ends and limitations/references/appendices begin.
+        Takes each page's lines (see _page_lines).
         Returns (page_index, is_mid_page) or None if not found.
         """
-        for page_idx, page_text in enumerate(page_texts):
-            lines = [line.strip() for line in page_text.split('\n') if line.strip()]
-            
+        for page_idx, lines in enumerate(page_lines):
+            page_lower = "\n".join(lines).lower()
+            has_keyword = any(keyword in page_lower for keyword in self.section_keywords)
             for line_idx, line in enumerate(lines):
+                # Lines are stripped, so without a keyword a match has to
+                # start with "[1]" or "1."
+                if not has_keyword and line[0] not in "[1":
+                    continue
                 # Use the unified section pattern
                 if self.section_patterns.search(line):
                     # Additional validation for numbered reference patterns
-                    if re.match(r'^\s*1\.\s+[A-Z]', line):
+                    if self.first_numbered_reference.match(line):
                         # Check if this looks like start of references by examining following lines
                         if self._looks_like_reference_section(lines, line_idx):
                             # Determine if this is mid-page or start of page
@@ -275,22 +491,21 @@ class PDFChecker:
         for i in range(start_idx, min(start_idx + 5, len(lines))):
             line = lines[i].strip()
             # Look for numbered references like "1.", "2.", etc.
-            if re.match(r'^\s*\d+\.\s+[A-Z]', line):
+            if self.numbered_reference.match(line):
                 reference_count += 1
             # Also look for bracket references like "[1]", "[2]", etc.
-            elif re.match(r'^\s*\[\d+\]', line):
+            elif self.bracket_reference.match(line):
                 reference_count += 1
         
         # If we found at least 2 consecutive reference-like lines, it's likely a reference section
         return reference_count >= 2
 
 
-    def _page_is_excluded_content(self, page_text: str, page_idx: int) -> bool:
+    def _page_is_excluded_content(self, page_text: str, lines: List[str]) -> bool:
         """
         Determine if a page contains only excluded content (references, appendices, etc.).
+        lines are the page's stripped, non-empty lines (see _page_lines).
         """
-        lines = [line.strip() for line in page_text.split('\n') if line.strip()]
-        
         if not lines:
             return True  # Empty page
         
@@ -299,38 +514,28 @@ class PDFChecker:
         total_substantial_lines = 0
         
         for line in lines:
-            # Skip very short lines (likely headers/footers)
-            if len(line.split()) < 3:
+            # Skip very short lines (likely headers/footers); splitting off
+            # three words is enough to tell
+            if len(line.split(None, 2)) < 3:
                 continue
                 
             total_substantial_lines += 1
             
             # Check if line looks like a reference
-            if (re.search(r'^\s*\[\d+\]', line) or
-                re.search(r'^\s*\d+\.\s+[A-Z]', line) or
-                re.search(r'^\s*[A-Z][^.]*\.\s*\([12]\d{3}\)', line) or  # Author (year)
-                re.search(r'^\s*[A-Z][^.]*\.\s+[A-Z][^.]*\.\s+\([12]\d{3}\)', line)):  # Author. Title. (year)
+            if self.reference_line.match(line):
                 reference_like_lines += 1
         
         # If more than 70% of substantial lines look like references, exclude this page
         if total_substantial_lines > 0 and reference_like_lines / total_substantial_lines > 0.7:
             return True
         
-        # Check for appendix content patterns
-        appendix_indicators = [
-            r'\bappendix\b',
-            r'\bsupplementary\b',
-            r'\badditional\s+results\b',
-            r'\bdetailed\s+proofs\b'
-        ]
-        
-        text_lower = page_text.lower()
-        appendix_matches = sum(1 for pattern in appendix_indicators 
-                              if re.search(pattern, text_lower))
-        
-        # If page has multiple appendix indicators, likely appendix content
-        if appendix_matches >= 2:
-            return True
+        # Check for appendix content patterns; if page has multiple (distinct)
+        # appendix indicators, likely appendix content
+        indicators_seen = set()
+        for match in self.appendix_indicators.finditer(page_text.lower()):
+            indicators_seen.add(match.lastindex)
+            if len(indicators_seen) >= 2:
+                return True
         
         return False
     
@@ -401,11 +606,12 @@ class PDFChecker:
         """Check if the paper has a limitations section using the unified regex pattern."""
         issues = []
         
-        # Use the unified section pattern but filter for limitations
-        lines = text.split('\n')
-        for line in lines:
-            line_clean = line.strip()
-            if self.section_patterns.search(line_clean) and 'limitation' in line_clean.lower():
+        # Use the unified section pattern but filter for limitations; only
+        # lines mentioning "limitation" can pass, so one scan picks those out
+        # instead of running the section pattern on every line
+        for match in self.limitation_lines.finditer(text):
+            line_clean = match.group().strip()
+            if 'limitation' in line_clean.lower() and self.section_patterns.search(line_clean):
                 return []  # Found limitations section
         
         # No limitations section found
@@ -422,9 +628,24 @@ class PDFChecker:
         """Check if the paper is properly anonymized."""
         issues = []
         
-        for pattern in self.anonymization_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        # One lowercase copy lets cheap substring tests rule out most patterns
+        # before running the (case-insensitive) regexes over the whole text
+        lowered = text.lower()
+        
+        # A name or address repeated throughout the paper is one issue,
+        # reported with the context of its first occurrence
+        seen = set()
+        
+        for pattern, keywords in zip(self.anonymization_regexes, self.anonymization_keywords):
+            if not any(keyword in lowered for keyword in keywords):
+                continue
+            matches = pattern.finditer(text)
             for match in matches:
+                key = match.group().lower()
+                if key in seen:
+                    continue
+                seen.add(key)
+                
                 # Extract context around the match
                 start = max(0, match.start() - 50)
                 end = min(len(text), match.end() + 50)
@@ -442,16 +663,12 @@ class PDFChecker:
     def _check_broken_references(self, text: str) -> List[Issue]:
         """Check for broken references indicated by '??' in the text."""
         issues = []
+        if '??' not in text:
+            return issues  # Every pattern below needs a literal '??'
         
         # Look for ?? patterns that typically indicate broken references
-        broken_ref_patterns = [
-            r'\?\?',  # Double question marks
-            r'\[.*\?\?.*\]',  # Question marks inside brackets like [??]
-            r'\(.*\?\?.*\)',  # Question marks inside parentheses like (??)
-        ]
-        
-        for pattern in broken_ref_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in self.broken_ref_patterns:
+            matches = pattern.finditer(text)
             for match in matches:
                 # Extract context around the match
                 start = max(0, match.start() - 50)
@@ -469,66 +686,86 @@ class PDFChecker:
     
     def _check_ethical_considerations(self, text: str) -> List[Issue]:
         """Check for ethical considerations section (warning if present)."""
-        issues = []
-        
-        # Look for ethical considerations patterns in the text
-        ethical_patterns = [
-            r'^\s*\d*\.?\s*ethical?\s+considerations?\s*$',      # "Ethical Considerations", "5. Ethical Considerations"
-            r'^\s*\d*\.?\s*ethicalconsiderations?\s*$',          # "EthicalConsiderations" (one word, exact match)
-            r'^\s*\d{1,4}\s+ethicalconsiderations?\s+',          # "588 EthicalConsiderations " (number + one word, flexible)
-            r'^\s*\d*\.?\s*ethics?\s*$',                         # "Ethics", "5. Ethics"
-            r'^\s*\d{1,3}\.\s*ethical?\s+considerations?\s*$',   # "5. Ethical Considerations"
-            r'^\s*\d{1,3}\s+ethical?\s+considerations?\s*$',     # "5 Ethical Considerations"
-            r'\b\d{1,4}\s+ethical?\s+considerations?\b',         # "592 Ethical Considerations"
-            r'\bethical?\s+considerations?\s*$',                 # "Ethical Considerations" (end of line)
-            r'\bethicalconsiderations?\s*$',                     # "EthicalConsiderations" (one word, end of line)
-            r'\bethics?\s*$',                                    # "Ethics" (end of line)
-        ]
-        
-        found_ethical = False
-        for pattern in ethical_patterns:
-            if found_ethical:
-                break
-            matches = re.finditer(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
+        # Every pattern needs the literal "ethic", so papers without it skip
+        # the full-text scans altogether
+        if 'ethic' not in text.lower():
+            return []
+        
+        # Patterns are tried in order and only the first hit is reported
+        for pattern in self.ethical_patterns:
+            match = pattern.search(text)
+            if match:
                 # Extract context around the match
                 start = max(0, match.start() - 30)
                 end = min(len(text), match.end() + 30)
                 context = text[start:end].replace('\n', ' ').strip()
                 
-                issues.append(Issue(
+                return [Issue(
                     issue_type=IssueType.ETHICAL_CONSIDERATIONS,
                     severity="warning",
                     message="Ethical considerations section found",
                     details=f"Found: '{match.group().strip()}' in context: '...{context}...'"
-                ))
-                found_ethical = True
-                break  # Only report once per paper
+                )]  # Only report once per paper
         
-        return issues
+        return []
     
-    def check_directory(self, directory_path: str, paper_type: PaperType) -> List[PDFCheckResult]:
+    def check_directory(
+        self, directory_path: str, paper_type: PaperType, recursive: bool = False
+    ) -> List[PDFCheckResult]:
         """
         Check all PDF files in a directory.
         
         Args:
             directory_path: Path to directory containing PDF files
             paper_type: Type of papers to check
+            recursive: Also check PDFs in subdirectories
             
         Returns:
             List of PDFCheckResult for each PDF found
         """
-        results = []
         directory = Path(directory_path)
         
         if not directory.exists():
             self.console.print(f"[red]Error: Directory '{directory_path}' does not exist[/red]")
-            return results
+            return []
         
-        pdf_files = list(directory.glob("*.pdf"))
+        pdf_files = find_pdfs(directory, recursive)
         if not pdf_files:
             self.console.print(f"[yellow]Warning: No PDF files found in '{directory_path}'[/yellow]")
-            return results
+            return []
+        
+        return self.check_files(pdf_files, paper_type)
+    
+    def check_files(
+        self,
+        pdf_files: List[Union[str, Path]],
+        paper_type: PaperType,
+        jobs: Optional[int] = None,
+        on_result: Optional[Callable[[PDFCheckResult], None]] = None,
+    ) -> List[PDFCheckResult]:
+        """
+        Check a known list of PDF files.
+        
+        Args:
+            pdf_files: Paths of the PDF files to check
+            paper_type: Type of papers to check
+            jobs: Number of worker processes (default: one per CPU core);
+                1 checks the files in this process
+            on_result: Called with each result as soon as its file finishes,
+                in completion order
+            
+        Returns:
+            List of PDFCheckResult, in the same order as pdf_files
+        """
+        if not pdf_files:
+            return []
+        
+        pdf_files = [Path(pdf_file) for pdf_file in pdf_files]
+        results: List[Optional[PDFCheckResult]] = [None] * len(pdf_files)
+        
+        # PDF parsing is CPU-bound and every file is independent, so fan the
+        # checks out across processes (one worker per core at most)
+        max_workers = min(len(pdf_files), jobs or os.cpu_count() or 1)
         
         # Create progress bar
         with Progress(
@@ -544,16 +781,49 @@ class PDFChecker:
         ) as progress:
             task = progress.add_task("", total=len(pdf_files))
             
-            for pdf_file in pdf_files:
-                # Update progress with current file name at the end
-                progress.update(task, description=f"[cyan]{pdf_file.name}[/cyan]")
+            def finish(index: int, result: PDFCheckResult) -> None:
+                # Update progress with the name of the file that just finished
+                progress.update(task, description=f"[cyan]{pdf_files[index].name}[/cyan]")
                 
-                result = self.check_pdf(str(pdf_file), paper_type)
-                results.append(result)
+                results[index] = result
+                if on_result is not None:
+                    on_result(result)
                 
                 # Advance progress
                 progress.advance(task)
             
+            if max_workers == 1:
+                for index, pdf_file in enumerate(pdf_files):
+                    finish(index, self.check_pdf(str(pdf_file), paper_type))
+            else:
+                # Serve cached files here; only the rest go to the workers
+                pending = {}
+                for index, pdf_file in enumerate(pdf_files):
+                    cache_key = self._cache_key(str(pdf_file), paper_type)
+                    cached = self._load_cached(cache_key, str(pdf_file))
+                    if cached is not None:
+                        finish(index, cached)
+                    else:
+                        pending[index] = cache_key
+                
+                if pending:
+                    # Progress runs a refresh thread, and forking a threaded
+                    # process can deadlock the child; spawn fresh workers instead
+                    with ProcessPoolExecutor(
+                        max_workers=min(len(pending), max_workers),
+                        mp_context=multiprocessing.get_context("spawn"),
+                    ) as executor:
+                        futures = {
+                            executor.submit(_check_pdf_worker, str(pdf_files[index]), paper_type, self.checks): index
+                            for index in pending
+                        }
+                        # Workers finish in arbitrary order; results keep the input order
+                        for future in as_completed(futures):
+                            index = futures[future]
+                            result = future.result()
+                            self._store_cached(pending[index], result)
+                            finish(index, result)
+            
             # Update to completion status
             progress.update(task, description=f"[green]Completed![/green]")
         
@@ -568,45 +838,62 @@ class PDFChecker:
             self.console.print("[yellow]No results to display[/yellow]")
             return
         
-        total_errors = 0
-        total_warnings = 0
-        
-        # Count totals for summary
+        # Detailed issues first, summary table at the end, rendered and
+        # written out in a single print
+        renderables = []
         for result in results:
-            error_count = sum(1 for issue in result.issues if issue.severity == "error")
-            warning_count = sum(1 for issue in result.issues if issue.severity == "warning")
-            total_errors += error_count
-            total_warnings += warning_count
+            panel = self._issues_panel(result)
+            if panel is not None:
+                renderables.extend(["", panel])
+        renderables.extend(["", self._summary_table(results)])
         
-        # Detailed issues first - only show errors and warnings, not info messages
-        for result in results:
-            # Only show issues that are errors or warnings, not info messages
-            significant_issues = [issue for issue in result.issues if issue.severity in ["error", "warning"]]
-            if significant_issues:
-                self.console.print()
-                filename = os.path.basename(result.file_path)
-                panel_title = f"Issues in {filename}"
-                
-                issue_text = ""
-                for issue in significant_issues:
-                    if issue.severity == "error":
-                        icon = "❌"
-                        color = "red"
-                    elif issue.severity == "warning":
-                        icon = "⚠️"
-                        color = "yellow"
-                    else:
-                        icon = "ℹ️"
-                        color = "blue"
-                    
-                    issue_text += f"{icon} [{color}]{issue.message}[/{color}]\n"
-                    if issue.details:
-                        issue_text += f"   {issue.details}\n"
-                    issue_text += "\n"
-                
-                self.console.print(Panel(issue_text.strip(), title=panel_title))
+        self.console.print(Group(*renderables))
+    
+    def print_issues(self, result: PDFCheckResult) -> None:
+        """Print the errors and warnings of a single result as a panel."""
+        panel = self._issues_panel(result)
+        if panel is None:
+            return
         
-        # Summary table at the end
+        self.console.print()
+        self.console.print(panel)
+    
+    def print_summary(self, results: List[PDFCheckResult]) -> None:
+        """Print the summary table for a list of results."""
+        self.console.print()
+        self.console.print(self._summary_table(results))
+    
+    def _issues_panel(self, result: PDFCheckResult) -> Optional[Panel]:
+        """Panel with the errors and warnings of a result, or None if it has none."""
+        # Only show issues that are errors or warnings, not info messages
+        significant_issues = [issue for issue in result.issues if issue.severity in ["error", "warning"]]
+        if not significant_issues:
+            return None
+        
+        filename = os.path.basename(result.file_path)
+        panel_title = f"Issues in {filename}"
+        
+        issue_parts = []
+        for issue in significant_issues:
+            if issue.severity == "error":
+                icon = "❌"
+                color = "red"
+            elif issue.severity == "warning":
+                icon = "⚠️"
+                color = "yellow"
+            else:
+                icon = "ℹ️"
+                color = "blue"
+            
+            issue_parts.append(f"{icon} [{color}]{issue.message}[/{color}]\n")
+            if issue.details:
+                issue_parts.append(f"   {issue.details}\n")
+            issue_parts.append("\n")
+        
+        return Panel("".join(issue_parts).strip(), title=panel_title)
+    
+    def _summary_table(self, results: List[PDFCheckResult]) -> Table:
+        """Build the summary table for a list of results."""
         table = Table(title="PDF Check Summary")
         table.add_column("File", style="cyan")
         table.add_column("Type", style="magenta")
@@ -627,9 +914,6 @@ class PDFChecker:
             else:
                 status = "[green]PASS[/green]"
             
-            error_count = sum(1 for issue in result.issues if issue.severity == "error")
-            warning_count = sum(1 for issue in result.issues if issue.severity == "warning")
-            
             # Create unique issue codes list instead of counts
             error_codes = list(set(issue.get_code() for issue in result.issues if issue.severity == "error"))
             warning_codes = list(set(issue.get_code() for issue in result.issues if issue.severity == "warning"))
@@ -653,5 +937,17 @@ class PDFChecker:
                 issues_text
             )
         
-        self.console.print()
-        self.console.print(table)
\ No newline at end of file
+        return table
+
+
+# Per-process checker used by the parallel directory scan. Console objects
+# don't pickle, so each worker builds its own (silent) checker on first use.
+_worker_checker: Optional[PDFChecker] = None
+
+
+def _check_pdf_worker(file_path: str, paper_type: PaperType, checks: frozenset) -> PDFCheckResult:
+    """Check a single PDF inside a worker process."""
+    global _worker_checker
+    if _worker_checker is None or _worker_checker.checks != checks:
+        _worker_checker = PDFChecker(console=Console(quiet=True), checks=checks)
+    return _worker_checker.check_pdf(file_path, paper_type)
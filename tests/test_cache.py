@@ -0,0 +1,56 @@
+"""
+Tests for the on-disk result cache.
+"""
+
+import os
+import time
+
+from service.cache import ResultCache, default_cache_dir, file_sha256
+
+
+class TestResultCache:
+    
+    def test_round_trip(self, tmp_path):
+        """Test that stored values are returned and unknown keys miss."""
+        cache = ResultCache(tmp_path)
+        
+        cache.set("key", {"email": "a@b.org", "name": "A B"})
+        
+        assert cache.get("key") == {"email": "a@b.org", "name": "A B"}
+        assert cache.get("other") is None
+    
+    def test_max_age_expires_old_entries(self, tmp_path):
+        """Test that entries older than max_age count as misses."""
+        cache = ResultCache(tmp_path)
+        cache.set("key", {"value": 1})
+        
+        # Backdate the entry by two hours
+        old = time.time() - 2 * 60 * 60
+        os.utime(tmp_path / "key.json", (old, old))
+        
+        assert cache.get("key", max_age=3 * 60 * 60) == {"value": 1}
+        assert cache.get("key") == {"value": 1}
+        assert cache.get("key", max_age=60 * 60) is None
+        
+        # The expired entry is gone for good
+        assert not (tmp_path / "key.json").exists()
+        assert cache.get("key") is None
+    
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test that an unreadable cache file is ignored rather than raising."""
+        (tmp_path / "key.json").write_text("{not json")
+        
+        assert ResultCache(tmp_path).get("key") is None
+    
+    def test_default_dir_respects_xdg_cache_home(self, tmp_path, monkeypatch):
+        """Test that XDG_CACHE_HOME overrides ~/.cache."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        
+        assert default_cache_dir() == tmp_path / "service-utils"
+    
+    def test_file_sha256(self, tmp_path):
+        """Test hashing a file's contents."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"abc")
+        
+        assert file_sha256(path) == "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
@@ -2,38 +2,43 @@
 Tests for CLI functionality.
 """
 
+import json
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, Mock
 from pathlib import Path
 
-from service.cli import main
+from service.cli import main, save_results_to_file, _render_paper_markdown
 from service.pdf_checker import PDFCheckResult, PaperType, Issue, IssueType
 
 
 class TestCLI:
     
+    # What the mocked checker reports for test.pdf unless a test says otherwise
+    RESULT = PDFCheckResult(
+        file_path="test.pdf",
+        paper_type=PaperType.LONG,
+        total_pages=6,
+        content_pages=6,
+        issues=[]
+    )
+    
     def setup_method(self):
         self.runner = CliRunner()
     
-    @patch('service.cli.PDFChecker')
-    @patch('pathlib.Path.is_file')
-    def test_check_pdf_single_file(self, mock_is_file, mock_pdf_checker_class):
+    @pytest.fixture
+    def mock_checker_class(self, monkeypatch):
+        """Replace PDFChecker (imported by check-pdf when it runs) with a mock."""
+        checker_class = Mock()
+        monkeypatch.setattr("service.pdf_checker.PDFChecker", checker_class)
+        return checker_class
+    
+    def test_check_pdf_single_file(self, mock_checker_class):
         """Test checking a single PDF file."""
-        mock_is_file.return_value = True
+        mock_checker = mock_checker_class.return_value
         
-        # Mock the PDFChecker instance and its methods
-        mock_checker = Mock()
-        mock_pdf_checker_class.return_value = mock_checker
-        
-        mock_result = PDFCheckResult(
-            file_path="test.pdf",
-            paper_type=PaperType.LONG,
-            total_pages=6,
-            content_pages=6,
-            issues=[]
-        )
-        mock_checker.check_pdf.return_value = mock_result
+        mock_checker.check_pdf.return_value = self.RESULT
         
         with self.runner.isolated_filesystem():
             # Create a test PDF file
@@ -45,15 +50,9 @@ class TestCLI:
             mock_checker.check_pdf.assert_called_once()
             mock_checker.print_results.assert_called_once()
     
-    @patch('service.cli.PDFChecker')
-    @patch('pathlib.Path.is_dir')
-    def test_check_pdf_directory(self, mock_is_dir, mock_pdf_checker_class):
+    def test_check_pdf_directory(self, mock_checker_class):
         """Test checking PDFs in a directory."""
-        mock_is_dir.return_value = True
-        
-        # Mock the PDFChecker instance
-        mock_checker = Mock()
-        mock_pdf_checker_class.return_value = mock_checker
+        mock_checker = mock_checker_class.return_value
         
         mock_results = [
             PDFCheckResult(
@@ -64,15 +63,66 @@ class TestCLI:
                 issues=[]
             )
         ]
-        mock_checker.check_directory.return_value = mock_results
+        mock_checker.check_files.return_value = mock_results
         
         with self.runner.isolated_filesystem():
             Path("papers").mkdir()
+            Path("papers/paper2.pdf").touch()
+            Path("papers/paper1.pdf").touch()
+            Path("papers/notes.txt").touch()
             
             result = self.runner.invoke(main, ['check-pdf', 'papers', '--type', 'short'])
             
             assert result.exit_code == 0
-            mock_checker.check_directory.assert_called_once()
+            assert "Found 2 PDF(s)" in result.output
+            mock_checker.check_files.assert_called_once_with(
+                [Path("papers/paper1.pdf"), Path("papers/paper2.pdf")], PaperType.SHORT,
+                jobs=None, on_result=mock_checker.print_issues,
+            )
+            mock_checker.print_summary.assert_called_once_with(mock_results)
+    
+    def test_check_pdf_directory_jobs(self, mock_checker_class):
+        """Test that --jobs is forwarded to the checker."""
+        mock_checker = mock_checker_class.return_value
+        mock_checker.check_files.return_value = []
+        
+        with self.runner.isolated_filesystem():
+            Path("papers").mkdir()
+            Path("papers/paper1.pdf").touch()
+            
+            result = self.runner.invoke(main, ['check-pdf', 'papers', '--jobs', '2', '--quiet'])
+            
+            assert result.exit_code == 0
+            _, kwargs = mock_checker.check_files.call_args
+            assert kwargs == {"jobs": 2, "on_result": None}
+    
+    def test_check_pdf_directory_recursive(self, mock_checker_class):
+        """Test that --recursive also picks up PDFs in subdirectories."""
+        mock_checker = mock_checker_class.return_value
+        mock_checker.check_files.return_value = []
+        
+        with self.runner.isolated_filesystem():
+            Path("papers/track-a").mkdir(parents=True)
+            Path("papers/top.pdf").touch()
+            Path("papers/track-a/nested.pdf").touch()
+            
+            self.runner.invoke(main, ['check-pdf', 'papers', '--quiet'])
+            flat_pdfs = mock_checker.check_files.call_args.args[0]
+            
+            self.runner.invoke(main, ['check-pdf', 'papers', '--quiet', '--recursive'])
+            all_pdfs = mock_checker.check_files.call_args.args[0]
+            
+            assert flat_pdfs == [Path("papers/top.pdf")]
+            assert all_pdfs == [Path("papers/top.pdf"), Path("papers/track-a/nested.pdf")]
+    
+    def test_check_pdf_rejects_zero_jobs(self):
+        """Test that --jobs must be at least 1."""
+        with self.runner.isolated_filesystem():
+            Path("papers").mkdir()
+            
+            result = self.runner.invoke(main, ['check-pdf', 'papers', '--jobs', '0'])
+            
+            assert result.exit_code != 0
     
     def test_check_pdf_invalid_file(self):
         """Test checking a non-PDF file."""
@@ -84,20 +134,69 @@ class TestCLI:
             assert result.exit_code != 0
             assert "must be a PDF" in result.output
     
+    def test_check_pdf_type_case_insensitive(self, mock_checker_class):
+        """Test that --type is mapped to PaperType regardless of case."""
+        mock_checker = mock_checker_class.return_value
+        mock_checker.check_pdf.return_value = PDFCheckResult(
+            file_path="test.pdf",
+            paper_type=PaperType.SHORT,
+            total_pages=4,
+            content_pages=4,
+            issues=[]
+        )
+        
+        with self.runner.isolated_filesystem():
+            Path("test.pdf").touch()
+            
+            result = self.runner.invoke(main, ['check-pdf', 'test.pdf', '--type', 'SHORT', '--quiet'])
+            
+            assert result.exit_code == 0
+            mock_checker.check_pdf.assert_called_once_with('test.pdf', PaperType.SHORT)
+            mock_checker.print_results.assert_not_called()
+    
+    def test_check_pdf_no_cache(self, mock_checker_class):
+        """Test that results are cached by default and --no-cache disables it."""
+        mock_checker = mock_checker_class.return_value
+        mock_checker.check_pdf.return_value = self.RESULT
+        
+        with self.runner.isolated_filesystem():
+            Path("test.pdf").touch()
+            
+            self.runner.invoke(main, ['check-pdf', 'test.pdf'])
+            assert mock_checker_class.call_args.kwargs["cache"] is not None
+            
+            result = self.runner.invoke(main, ['check-pdf', 'test.pdf', '--no-cache'])
+            assert result.exit_code == 0
+            assert mock_checker_class.call_args.kwargs["cache"] is None
+    
+    def test_check_pdf_skip(self, mock_checker_class):
+        """Test that --skip leaves the named checks out."""
+        mock_checker = mock_checker_class.return_value
+        mock_checker.check_pdf.return_value = self.RESULT
+        
+        with self.runner.isolated_filesystem():
+            Path("test.pdf").touch()
+            
+            self.runner.invoke(main, ['check-pdf', 'test.pdf'])
+            assert set(mock_checker_class.call_args.kwargs["checks"]) == set(IssueType)
+            
+            result = self.runner.invoke(
+                main, ['check-pdf', 'test.pdf', '--skip', 'anonymization', '--skip', 'Ethical_Considerations']
+            )
+            assert result.exit_code == 0
+            assert set(mock_checker_class.call_args.kwargs["checks"]) == {
+                IssueType.PAGE_LIMIT, IssueType.MISSING_LIMITATIONS, IssueType.BROKEN_REFERENCES
+            }
+    
     def test_check_pdf_nonexistent_path(self):
         """Test checking a non-existent path."""
         result = self.runner.invoke(main, ['check-pdf', 'nonexistent.pdf'])
         
         assert result.exit_code != 0
     
-    @patch('service.cli.PDFChecker')
-    @patch('pathlib.Path.is_file')
-    def test_check_pdf_with_errors_exits_normally(self, mock_is_file, mock_pdf_checker_class):
+    def test_check_pdf_with_errors_exits_normally(self, mock_checker_class):
         """Test that CLI exits normally (code 0) even when PDF has issues."""
-        mock_is_file.return_value = True
-        
-        mock_checker = Mock()
-        mock_pdf_checker_class.return_value = mock_checker
+        mock_checker = mock_checker_class.return_value
         
         # Create a result with errors
         mock_result = PDFCheckResult(
@@ -119,24 +218,13 @@ class TestCLI:
             # CLI exits normally even with errors (user preference)
             assert result.exit_code == 0
     
-    @patch('service.cli.save_results_to_file')
-    @patch('service.cli.PDFChecker')
-    @patch('pathlib.Path.is_file')
-    def test_check_pdf_with_output_file(self, mock_is_file, mock_pdf_checker_class, mock_save):
+    def test_check_pdf_with_output_file(self, mock_checker_class, monkeypatch):
         """Test saving results to output file."""
-        mock_is_file.return_value = True
-        
-        mock_checker = Mock()
-        mock_pdf_checker_class.return_value = mock_checker
+        mock_checker = mock_checker_class.return_value
+        mock_save = Mock()
+        monkeypatch.setattr("service.cli.save_results_to_file", mock_save)
         
-        mock_result = PDFCheckResult(
-            file_path="test.pdf",
-            paper_type=PaperType.LONG,
-            total_pages=6,
-            content_pages=6,
-            issues=[]
-        )
-        mock_checker.check_pdf.return_value = mock_result
+        mock_checker.check_pdf.return_value = self.RESULT
         
         with self.runner.isolated_filesystem():
             Path("test.pdf").touch()
@@ -145,4 +233,99 @@ class TestCLI:
             
             assert result.exit_code == 0
             mock_save.assert_called_once()
-            assert "saved to results.json" in result.output
\ No newline at end of file
+            assert "saved to results.json" in result.output
+
+
+class TestSaveResults:
+    
+    RESULTS = [
+        PDFCheckResult(
+            file_path="paper.pdf",
+            paper_type=PaperType.SHORT,
+            total_pages=6,
+            content_pages=5,
+            issues=[
+                Issue(IssueType.PAGE_LIMIT, "error", "Too many pages", "Found 5 content pages"),
+                Issue(IssueType.ANONYMIZATION, "warning", "Email found"),
+            ]
+        )
+    ]
+    
+    EXPECTED = [
+        {
+            "file_path": "paper.pdf",
+            "paper_type": "short",
+            "total_pages": 6,
+            "content_pages": 5,
+            "issues": [
+                {
+                    "issue_type": "page_limit",
+                    "severity": "error",
+                    "message": "Too many pages",
+                    "details": "Found 5 content pages",
+                },
+                {
+                    "issue_type": "anonymization",
+                    "severity": "warning",
+                    "message": "Email found",
+                    "details": None,
+                },
+            ],
+        }
+    ]
+    
+    def test_save_results_to_file(self, tmp_path):
+        """Test that results are written as JSON with enums converted to their values."""
+        output = tmp_path / "results.json"
+        
+        save_results_to_file(self.RESULTS, str(output))
+        
+        assert json.loads(output.read_text()) == self.EXPECTED
+    
+    def test_save_results_to_file_without_orjson(self, tmp_path):
+        """Test the stdlib json fallback produces the same document."""
+        output = tmp_path / "results.json"
+        
+        with patch.dict('sys.modules', {'orjson': None}):
+            save_results_to_file(self.RESULTS, str(output))
+        
+        assert json.loads(output.read_text()) == self.EXPECTED
+
+
+class TestRenderPaperMarkdown:
+    
+    def test_render_paper_markdown(self):
+        """Test rendering of short/long content fields across thread sections."""
+        paper = {
+            "paper_number": 7,
+            "title": "A Paper",
+            "authors": "A. Author",
+            "abstract": "An abstract.",
+            "reviews": [
+                {"signatures": ["Reviewer 1"], "content": {"rating": 4, "summary": "Long\ntext", "empty": ""}},
+            ],
+            "meta_reviews": [],
+            "decisions": [
+                {"signatures": ["Program Chairs"], "content": {"decision": "Accept"}},
+            ],
+            "comments": [
+                {"signatures": ["Authors"], "content": {"title": "Thanks", "comment": "We\nagree"}},
+            ],
+        }
+        
+        md = _render_paper_markdown(paper)
+        
+        assert md == (
+            "# Paper 7: A Paper\n\n"
+            "**Authors:** A. Author\n\n"
+            "## Abstract\n\nAn abstract.\n\n"
+            "---\n\n## Review 1 (Reviewer 1)\n\n"
+            "**Rating:** 4\n\n"
+            "### Summary\n\nLong\ntext\n\n"
+            "---\n\n## Decision (Program Chairs)\n\n"
+            "**Decision:** Accept\n\n"
+            "---\n\n## Comments\n\n"
+            "### Comment by Authors\n\n"
+            "**Title:** Thanks\n\n"
+            "We\nagree\n"
+        )
@@ -0,0 +1,189 @@
+"""
+Tests for SMTP sending against a fake server (no network access).
+"""
+
+import re
+import smtplib
+from unittest.mock import patch
+
+import pytest
+
+from service.email_sender import _MessageNotSent, _send_message, send_reminder_emails
+
+
+class FakeSMTP:
+    """
+    Stands in for an authenticated smtplib session.
+    
+    Pipelined commands written with send() are answered in order by
+    getreply(); recipients listed in `refused` get a 550 for RCPT TO and
+    the BDAT that follows it.
+    """
+    
+    def __init__(self, extensions=("pipelining", "chunking"), refused=(), fail_send=None, fail_reply=None, fail_rset=None):
+        self.extensions = set(extensions)
+        self.refused = set(refused)
+        self.fail_send = fail_send  # raised by the next send()
+        self.fail_reply = fail_reply  # raised by the next getreply()
+        self.fail_rset = fail_rset  # raised by rset()
+        self.delivered = []  # recipients whose message was accepted
+        self.calls = []
+        self.connected = True
+        self._replies = []
+    
+    def has_extn(self, name):
+        return name in self.extensions
+    
+    def send(self, data):
+        self.calls.append("send")
+        if self.fail_send is not None:
+            error, self.fail_send = self.fail_send, None
+            self.connected = False  # smtplib closes the socket on a failed send
+            raise error
+        recipient = re.search(rb"RCPT TO:<([^>]*)>", data).group(1).decode()
+        if recipient in self.refused:
+            self._replies += [(250, b"OK"), (550, b"No such user"), (554, b"No valid recipients")]
+        else:
+            self._replies += [(250, b"OK"), (250, b"OK"), (250, b"Queued")]
+            self.delivered.append(recipient)
+    
+    def getreply(self):
+        if self.fail_reply is not None:
+            error, self.fail_reply = self.fail_reply, None
+            raise error
+        return self._replies.pop(0)
+    
+    def sendmail(self, sender, recipients, message):
+        self.calls.append("sendmail")
+        self.delivered.extend(recipients)
+    
+    def rset(self):
+        self.calls.append("rset")
+        if self.fail_rset is not None:
+            raise self.fail_rset
+    
+    def noop(self):
+        if not self.connected:
+            raise smtplib.SMTPServerDisconnected("please run connect() first")
+        return (250, b"OK")
+    
+    def close(self):
+        self.connected = False
+    
+    def quit(self):
+        self.calls.append("quit")
+
+
+def _entry(email):
+    return {"reviewer_email": email, "reviewer_name": "Reviewer", "paper_title": "A Paper"}
+
+
+class TestSendMessage:
+    
+    def test_accepted_message_is_pipelined(self):
+        """Test that a server with PIPELINING and CHUNKING gets one pipelined write."""
+        server = FakeSMTP()
+        
+        _send_message(server, "ac@example.com", "reviewer@example.com", b"Subject: Hi\r\n\r\nBody")
+        
+        assert server.calls == ["send"]
+        assert server.delivered == ["reviewer@example.com"]
+    
+    def test_refused_recipient_resets_session(self):
+        """Test that a refused RCPT raises SMTPRecipientsRefused after an RSET."""
+        server = FakeSMTP(refused={"gone@example.com"})
+        
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            _send_message(server, "ac@example.com", "gone@example.com", b"Body\r\n")
+        
+        assert server.calls == ["send", "rset"]
+        assert server._replies == []  # every pipelined reply was read
+    
+    def test_rset_failure_keeps_rejection(self):
+        """Test that an error from RSET does not hide the RCPT rejection."""
+        server = FakeSMTP(refused={"gone@example.com"}, fail_rset=smtplib.SMTPResponseException(421, b"Bye"))
+        
+        with pytest.raises(smtplib.SMTPRecipientsRefused):
+            _send_message(server, "ac@example.com", "gone@example.com", b"Body\r\n")
+    
+    def test_failed_write_is_not_sent(self):
+        """Test that a failed pipelined write is reported as safe to resend."""
+        server = FakeSMTP(fail_send=smtplib.SMTPServerDisconnected("Server not connected"))
+        
+        with pytest.raises(_MessageNotSent):
+            _send_message(server, "ac@example.com", "reviewer@example.com", b"Body\r\n")
+    
+    def test_failed_reply_may_have_been_sent(self):
+        """Test that a drop while reading replies is not reported as safe to resend."""
+        server = FakeSMTP(fail_reply=smtplib.SMTPServerDisconnected("Connection unexpectedly closed"))
+        
+        with pytest.raises(smtplib.SMTPServerDisconnected) as excinfo:
+            _send_message(server, "ac@example.com", "reviewer@example.com", b"Body\r\n")
+        
+        assert not isinstance(excinfo.value, _MessageNotSent)
+    
+    def test_newline_in_address_is_rejected(self):
+        """Test that a CR/LF in an address never reaches the session."""
+        server = FakeSMTP()
+        
+        with pytest.raises(ValueError):
+            _send_message(server, "ac@example.com", "a@example.com>\r\nRCPT TO:<b@example.com", b"Body\r\n")
+        
+        assert server.calls == []
+    
+    def test_falls_back_to_sendmail(self):
+        """Test that servers without CHUNKING get a plain sendmail()."""
+        server = FakeSMTP(extensions=("pipelining",))
+        
+        _send_message(server, "ac@example.com", "reviewer@example.com", b"Body\r\n")
+        
+        assert server.calls == ["sendmail"]
+        assert server.delivered == ["reviewer@example.com"]
+
+
+class TestSendReminderEmails:
+    
+    def test_session_is_reused_after_refused_recipient(self):
+        """Test that one session sends every message, including after a refusal."""
+        server = FakeSMTP(refused={"gone@example.com"})
+        entries = [_entry("first@example.com"), _entry("gone@example.com"), _entry("last@example.com")]
+        
+        with patch("service.email_sender._connect", return_value=server) as connect:
+            results = send_reminder_emails(
+                "ac@example.com", "The AC", "secret", entries, concurrency=1
+            )
+        
+        connect.assert_called_once()
+        assert [result[:2] for result in results] == [
+            ("first@example.com", True),
+            ("gone@example.com", False),
+            ("last@example.com", True),
+        ]
+        assert server.delivered == ["first@example.com", "last@example.com"]
+        assert server.calls == ["send", "send", "rset", "send", "quit"]
+    
+    def test_unsent_message_is_retried_on_new_session(self):
+        """Test that a write that failed before reaching the server is sent again."""
+        stale = FakeSMTP(fail_send=smtplib.SMTPServerDisconnected("Server not connected"))
+        fresh = FakeSMTP()
+        
+        with patch("service.email_sender._connect", side_effect=[stale, fresh]):
+            results = send_reminder_emails(
+                "ac@example.com", "The AC", "secret", [_entry("first@example.com")], concurrency=1
+            )
+        
+        assert results == [("first@example.com", True)]
+        assert fresh.delivered == ["first@example.com"]
+    
+    def test_lost_reply_is_not_resent(self):
+        """Test that a drop after the message was written is reported, not resent."""
+        server = FakeSMTP(fail_reply=smtplib.SMTPServerDisconnected("Connection unexpectedly closed"))
+        
+        with patch("service.email_sender._connect", return_value=server) as connect:
+            results = send_reminder_emails(
+                "ac@example.com", "The AC", "secret", [_entry("first@example.com")], concurrency=1
+            )
+        
+        connect.assert_called_once()
+        assert results[0][:2] == ("first@example.com", False)
+        assert server.calls.count("send") == 1
@@ -0,0 +1,152 @@
+"""
+Tests for the OpenReview helpers that don't need network access.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from service import openreview_client
+from service.openreview_client import _Throttle, _compute_missing, _get_notes, _get_throttle
+
+
+def _note(signatures, **kwargs):
+    return SimpleNamespace(signatures=signatures, **kwargs)
+
+
+def _group(group_id, members):
+    return SimpleNamespace(id=group_id, members=members)
+
+
+class TestComputeMissing:
+    
+    def setup_method(self):
+        self.paper = _note(
+            [], id="paper1", number=7, content={"title": {"value": "A Paper"}}
+        )
+        self.anon_groups = [
+            _group("V/Submission7/Reviewer_a", ["~Alice1"]),
+            _group("V/Submission7/Reviewer_b", ["~Bob1"]),
+            _group("V/Submission7/Reviewer_c", ["~Carol1"]),
+        ]
+    
+    def test_reviewers_who_submitted_are_excluded(self):
+        """Test that only assigned reviewers without a review are returned."""
+        reviews = [_note(["V/Submission7/Reviewer_a"])]
+        
+        missing = _compute_missing(
+            self.paper, ["~Alice1", "~Bob1", "~Carol1"], reviews, [], self.anon_groups
+        )
+        
+        assert [m["reviewer_id"] for m in missing] == ["~Bob1", "~Carol1"]
+        assert missing[0] == {
+            "paper_title": "A Paper",
+            "paper_number": 7,
+            "paper_id": "paper1",
+            "reviewer_id": "~Bob1",
+            "flag": "",
+        }
+    
+    def test_emergency_declarations_are_flagged(self):
+        """Test that reviewers who declared an emergency are flagged."""
+        emergencies = [_note(["V/Submission7/Reviewer_b"])]
+        
+        missing = _compute_missing(
+            self.paper, ["~Alice1", "~Bob1"], [], emergencies, self.anon_groups
+        )
+        
+        assert [(m["reviewer_id"], m["flag"]) for m in missing] == [
+            ("~Alice1", ""),
+            ("~Bob1", "Emergency"),
+        ]
+    
+    def test_unknown_signatures_are_ignored(self):
+        """Test that reviews signed by unmapped groups don't count."""
+        reviews = [_note(["V/Submission7/Reviewer_z"]), _note(None)]
+        
+        missing = _compute_missing(
+            self.paper, ["~Alice1"], reviews, [], self.anon_groups
+        )
+        
+        assert [m["reviewer_id"] for m in missing] == ["~Alice1"]
+
+
+class TestThrottle:
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake monotonic clock that time.sleep() advances instead of blocking."""
+        now = [0.0]
+        monkeypatch.setattr(openreview_client.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(openreview_client.time, "sleep", lambda seconds: now.__setitem__(0, now[0] + seconds))
+        return now
+    
+    def test_rate_below_one_per_second(self, clock):
+        """Test that rates below 1/sec still let calls through, spaced 1/rps apart."""
+        throttle = _Throttle(0.5)
+        
+        throttle.acquire()
+        assert clock[0] == 0.0
+        throttle.acquire()
+        assert clock[0] == pytest.approx(2.0)
+    
+    @pytest.mark.parametrize("value", ["0", "-1", "fast", "nan"])
+    def test_invalid_rate_is_reported(self, monkeypatch, value):
+        """Test that a bad OPENREVIEW_RPS raises a readable RuntimeError."""
+        monkeypatch.setattr(openreview_client, "_throttle", None)
+        monkeypatch.setenv("OPENREVIEW_RPS", value)
+        
+        with pytest.raises(RuntimeError, match="OPENREVIEW_RPS"):
+            _get_throttle()
+
+
+class FakeNotesClient:
+    """Serves notes by ID and records how many were fetched."""
+    
+    def __init__(self):
+        self.fetched = []
+    
+    def get_notes_by_ids(self, ids):
+        self.fetched.extend(ids)
+        return [SimpleNamespace(id=nid) for nid in ids]
+
+
+class TestNoteCache:
+    
+    @pytest.fixture(autouse=True)
+    def unthrottled(self, monkeypatch):
+        """Call API functions directly, without the shared rate limit."""
+        monkeypatch.setattr(openreview_client, "_call", lambda fn, *args: fn(*args))
+    
+    def test_notes_are_reused_per_client(self):
+        """Test that a client reuses its own notes but never another client's."""
+        first, second = FakeNotesClient(), FakeNotesClient()
+        
+        _get_notes(first, ["a", "b"])
+        _get_notes(first, ["a"])
+        _get_notes(second, ["a"])
+        
+        assert first.fetched == ["a", "b"]
+        assert second.fetched == ["a"]
+    
+    def test_cache_is_capped(self, monkeypatch):
+        """Test that the oldest notes are evicted once the cache is full."""
+        monkeypatch.setattr(openreview_client, "NOTE_CACHE_MAXSIZE", 2)
+        client = FakeNotesClient()
+        
+        _get_notes(client, ["a"])
+        _get_notes(client, ["b", "c"])
+        
+        assert list(openreview_client._note_caches[client]) == ["b", "c"]
+    
+    def test_expired_notes_are_dropped(self, monkeypatch):
+        """Test that expired notes are removed on the next write."""
+        now = [0.0]
+        monkeypatch.setattr(openreview_client.time, "monotonic", lambda: now[0])
+        client = FakeNotesClient()
+        
+        _get_notes(client, ["a"])
+        now[0] += openreview_client.NOTE_CACHE_TTL + 1
+        _get_notes(client, ["b"])
+        
+        assert list(openreview_client._note_caches[client]) == ["b"]
@@ -2,34 +2,69 @@
 Tests for PDF checker functionality using real PDFs from the data folder.
 """
 
+import re
+
 import pytest
+from dataclasses import replace
 from pathlib import Path
+from unittest.mock import patch
 import os
 
+from service.cache import ResultCache
 from service.pdf_checker import PDFChecker, PaperType, Issue, IssueType, PDFCheckResult
 
 
-class TestPDFCheckerRealFiles:
-    """Test PDF checker using actual PDF files from the data directory."""
+def _found_matches(issues):
+    """The matched text of each anonymization issue ("Found: '<match>' in context: ...")."""
+    return {re.match(r"Found: '(.*?)' in context: ", issue.details).group(1) for issue in issues}
+
+
+@pytest.fixture(scope="session")
+def data_dir():
+    """Get the path to the data directory with test PDFs."""
+    current_dir = Path(__file__).parent.parent
+    return current_dir / "data"
+
+
+@pytest.fixture(scope="module")
+def checker():
+    """
+    A PDFChecker without a cache, shared by the tests in this module.
     
-    @pytest.fixture
-    def checker(self):
-        """Create a PDFChecker instance for testing."""
-        return PDFChecker()
+    The checks keep no state between calls, so one instance serves all.
+    """
+    return PDFChecker()
+
+
+@pytest.fixture(scope="session")
+def check_result(data_dir):
+    """
+    Check a sample PDF as the given paper type, once per test session.
     
-    @pytest.fixture
-    def data_dir(self):
-        """Get the path to the data directory with test PDFs."""
-        current_dir = Path(__file__).parent.parent
-        return current_dir / "data"
+    Parsing dominates these tests, so each (file, paper type) pair is
+    checked on first use and the result shared by the tests asking again.
+    """
+    checker = PDFChecker()
+    results = {}
+    
+    def get(name, paper_type=PaperType.LONG):
+        if (name, paper_type) not in results:
+            pdf_path = data_dir / name
+            if not pdf_path.exists():
+                pytest.skip(f"Test PDF not found: {pdf_path}")
+            results[name, paper_type] = checker.check_pdf(str(pdf_path), paper_type)
+        return results[name, paper_type]
     
-    def test_grade_pass_pdf(self, checker, data_dir):
+    return get
+
+
+class TestPDFCheckerRealFiles:
+    """Test PDF checker using actual PDF files from the data directory."""
+    
+    def test_grade_pass_pdf(self, check_result, data_dir):
         """Test grade_pass.pdf - should pass all checks (with info about being at limit)."""
         pdf_path = data_dir / "grade_pass.pdf"
-        if not pdf_path.exists():
-            pytest.skip(f"Test PDF not found: {pdf_path}")
-        
-        result = checker.check_pdf(str(pdf_path), PaperType.LONG)
+        result = check_result("grade_pass.pdf")
         
         # Expected results based on actual output
         assert result.file_path == str(pdf_path)
@@ -46,13 +81,10 @@ class TestPDFCheckerRealFiles:
         assert issue.severity == "info"
         assert "at the page limit" in issue.message
     
-    def test_grade_long_too_long_pdf(self, checker, data_dir):
+    def test_grade_long_too_long_pdf(self, check_result, data_dir):
         """Test grade_long_too-long.pdf - should fail on page limit."""
         pdf_path = data_dir / "grade_long_too-long.pdf"
-        if not pdf_path.exists():
-            pytest.skip(f"Test PDF not found: {pdf_path}")
-        
-        result = checker.check_pdf(str(pdf_path), PaperType.LONG)
+        result = check_result("grade_long_too-long.pdf")
         
         # Expected results
         assert result.file_path == str(pdf_path)
@@ -69,13 +101,10 @@ class TestPDFCheckerRealFiles:
         assert "exceeds page limit" in issue.message
         assert "Found 9 content pages, limit is 8 pages" in issue.details
     
-    def test_grade_no_limitations_pdf(self, checker, data_dir):
+    def test_grade_no_limitations_pdf(self, check_result, data_dir):
         """Test grade_no-limitations.pdf - should fail on missing limitations."""
         pdf_path = data_dir / "grade_no-limitations.pdf"
-        if not pdf_path.exists():
-            pytest.skip(f"Test PDF not found: {pdf_path}")
-        
-        result = checker.check_pdf(str(pdf_path), PaperType.LONG)
+        result = check_result("grade_no-limitations.pdf")
         
         # Expected results
         assert result.file_path == str(pdf_path)
@@ -96,13 +125,10 @@ class TestPDFCheckerRealFiles:
         assert len(page_limit_issues) == 1
         assert page_limit_issues[0].severity == "info"
     
-    def test_ngram_novelty_pdf(self, checker, data_dir):
+    def test_ngram_novelty_pdf(self, check_result, data_dir):
         """Test ngram-novelty.pdf - should fail on page limit and have anonymization warnings."""
         pdf_path = data_dir / "ngram-novelty.pdf"
-        if not pdf_path.exists():
-            pytest.skip(f"Test PDF not found: {pdf_path}")
-        
-        result = checker.check_pdf(str(pdf_path), PaperType.LONG)
+        result = check_result("ngram-novelty.pdf")
         
         # Expected results
         assert result.file_path == str(pdf_path)
@@ -124,18 +150,13 @@ class TestPDFCheckerRealFiles:
         assert all(issue.severity == "warning" for issue in anon_issues)
         
         # Check for specific email domains
-        anon_details = [issue.details for issue in anon_issues]
-        assert any("@nyu.edu" in details for details in anon_details)
-        assert any("@allenai.org" in details for details in anon_details)
-        assert any("@gmail.com" in details for details in anon_details)
+        found = _found_matches(anon_issues)
+        assert found == {"@nyu.edu", "@allenai.org", "@gmail.com"}
     
-    def test_short_ok_pdf(self, checker, data_dir):
+    def test_short_ok_pdf(self, check_result, data_dir):
         """Test short-ok.pdf - should have broken reference warnings."""
         pdf_path = data_dir / "short-ok.pdf"
-        if not pdf_path.exists():
-            pytest.skip(f"Test PDF not found: {pdf_path}")
-        
-        result = checker.check_pdf(str(pdf_path), PaperType.LONG)
+        result = check_result("short-ok.pdf")
         
         # Expected results
         assert result.file_path == str(pdf_path)
@@ -153,13 +174,10 @@ class TestPDFCheckerRealFiles:
             assert "Broken reference detected" in issue.message
             assert "??" in issue.details
     
-    def test_long_ethics_pdf(self, checker, data_dir):
+    def test_long_ethics_pdf(self, check_result, data_dir):
         """Test long-ethics.pdf - should have ethical considerations warning."""
         pdf_path = data_dir / "long-ethics.pdf"
-        if not pdf_path.exists():
-            pytest.skip(f"Test PDF not found: {pdf_path}")
-        
-        result = checker.check_pdf(str(pdf_path), PaperType.LONG)
+        result = check_result("long-ethics.pdf")
         
         # Expected results
         assert result.file_path == str(pdf_path)
@@ -182,64 +200,67 @@ class TestPDFCheckerRealFiles:
         assert len(page_limit_issues) == 1
         assert page_limit_issues[0].severity == "info"
 
+    def test_check_directory_matches_single_checks(self, checker, check_result, data_dir, tmp_path):
+        """Test that the parallel directory scan returns the same results as per-file checks, sorted by path."""
+        names = ["short-ok.pdf", "ngram-novelty.pdf"]
+        for name in names:
+            if not (data_dir / name).exists():
+                pytest.skip(f"Test PDF not found: {data_dir / name}")
+            (tmp_path / name).write_bytes((data_dir / name).read_bytes())
+
+        results = checker.check_directory(str(tmp_path), PaperType.LONG)
+
+        assert [Path(r.file_path).name for r in results] == sorted(names)
+        for result in results:
+            expected = check_result(Path(result.file_path).name)
+            assert result == replace(expected, file_path=result.file_path)
+
+    def test_check_files_single_job_streams_results(self, checker, check_result, data_dir):
+        """Test that check_files with jobs=1 checks inline and reports each result as it finishes."""
+        pdf_path = data_dir / "short-ok.pdf"
+        if not pdf_path.exists():
+            pytest.skip(f"Test PDF not found: {pdf_path}")
+
+        streamed = []
+        results = checker.check_files([pdf_path], PaperType.SHORT, jobs=1, on_result=streamed.append)
+
+        assert results == streamed
+        assert results == [check_result("short-ok.pdf", PaperType.SHORT)]
+
 
 class TestPDFCheckerUnitMethods:
     """Test individual methods of PDFChecker with controlled inputs."""
     
-    @pytest.fixture
-    def checker(self):
-        """Create a PDFChecker instance for testing."""
-        return PDFChecker()
-    
-    def test_check_page_limits_short_paper_exceeded(self, checker):
-        """Test page limit check for short paper that exceeds limit."""
-        issues = checker._check_page_limits(5, PaperType.SHORT)
-        
+    @pytest.mark.parametrize("content_pages, paper_type, severity, message, details", [
+        (5, PaperType.SHORT, "error", "exceeds page limit", "Found 5 content pages, limit is 4 pages"),
+        (9, PaperType.LONG, "error", "exceeds page limit", "Found 9 content pages, limit is 8 pages"),
+        (3, PaperType.SHORT, None, None, None),
+        (6, PaperType.LONG, None, None, None),
+        (4, PaperType.SHORT, "info", "at the page limit", None),
+        (8, PaperType.LONG, "info", "at the page limit", None),
+    ])
+    def test_check_page_limits(self, checker, content_pages, paper_type, severity, message, details):
+        """Test the page limit check below, at and above the limit of each paper type."""
+        issues = checker._check_page_limits(content_pages, paper_type)
+        
+        if severity is None:
+            assert len(issues) == 0
+            return
         assert len(issues) == 1
         assert issues[0].issue_type == IssueType.PAGE_LIMIT
-        assert issues[0].severity == "error"
-        assert "exceeds page limit" in issues[0].message
+        assert issues[0].severity == severity
+        assert message in issues[0].message
+        if details is not None:
+            assert details in issues[0].details
     
-    def test_check_page_limits_long_paper_exceeded(self, checker):
-        """Test page limit check for long paper that exceeds limit."""
-        issues = checker._check_page_limits(9, PaperType.LONG)
-        
-        assert len(issues) == 1
-        assert issues[0].issue_type == IssueType.PAGE_LIMIT
-        assert issues[0].severity == "error"
-        assert "exceeds page limit" in issues[0].message
-        assert "Found 9 content pages, limit is 8 pages" in issues[0].details
-    
-    def test_check_page_limits_within_limit(self, checker):
-        """Test page limit check for papers within limits."""
-        # Short paper within limit
-        issues = checker._check_page_limits(3, PaperType.SHORT)
-        assert len(issues) == 0
-        
-        # Long paper within limit
-        issues = checker._check_page_limits(6, PaperType.LONG)
-        assert len(issues) == 0
-    
-    def test_check_page_limits_at_limit(self, checker):
-        """Test page limit check for papers exactly at the limit."""
-        # Exactly at limit generates info issue
-        issues = checker._check_page_limits(4, PaperType.SHORT)
-        assert len(issues) == 1
-        assert issues[0].severity == "info"
-        assert "at the page limit" in issues[0].message
-        
-        issues = checker._check_page_limits(8, PaperType.LONG)
-        assert len(issues) == 1
-        assert issues[0].severity == "info"
-        assert "at the page limit" in issues[0].message
-    
-    def test_check_limitations_section_present(self, checker):
-        """Test detection of limitations section when present."""
-        text = """
+    @pytest.mark.parametrize("heading", ["Limitations", "5. Limitations"])
+    def test_check_limitations_section_present(self, checker, heading):
+        """Test detection of a plain or numbered limitations section."""
+        text = f"""
         Introduction
         This is our paper.
         
-        Limitations
+        {heading}
         Our work has several limitations.
         
         Conclusion
@@ -249,22 +270,6 @@ class TestPDFCheckerUnitMethods:
         issues = checker._check_limitations_section(text)
         assert len(issues) == 0
     
-    def test_check_limitations_section_numbered_format(self, checker):
-        """Test detection of numbered limitations section."""
-        text = """
-        Introduction
-        This is our paper.
-        
-        5. Limitations
-        Our work has several limitations.
-        
-        6. Conclusion
-        We conclude that...
-        """
-        
-        issues = checker._check_limitations_section(text)
-        assert len(issues) == 0
-    
     def test_check_limitations_section_missing(self, checker):
         """Test detection when limitations section is missing."""
         text = """
@@ -300,9 +305,8 @@ class TestPDFCheckerUnitMethods:
         assert all(issue.severity == "warning" for issue in issues)
         
         # Check that email patterns are detected
-        details = [issue.details for issue in issues]
-        assert any("@university.edu" in detail for detail in details)
-        assert any("@company.com" in detail for detail in details)
+        found = _found_matches(issues)
+        assert {"@university.edu", "@company.com"} <= found
     
     def test_check_anonymization_clean(self, checker):
         """Test anonymization check with clean text."""
@@ -315,6 +319,42 @@ class TestPDFCheckerUnitMethods:
         issues = checker._check_anonymization(text)
         assert len(issues) == 0
     
+    def test_check_anonymization_keywords_any_case(self, checker):
+        """Test that the keyword prefilter doesn't hide matches written in other cases."""
+        text = """
+        STANFORD UNIVERSITY
+        DEPARTMENT: Computer Science
+        """
+        
+        issues = checker._check_anonymization(text)
+        details = " ".join(issue.details for issue in issues)
+        assert "STANFORD UNIVERSITY" in details
+        assert "DEPARTMENT: C" in details
+    
+    def test_check_anonymization_repeated_match_reported_once(self, checker):
+        """Test that a name repeated across the paper yields a single issue."""
+        text = """
+        Work done at Stanford University.
+        Experiments ran on the Stanford University cluster.
+        Thanks to Stanford university and Mellon College.
+        """
+        
+        issues = checker._check_anonymization(text)
+        assert len(issues) == 2
+        assert "Work done at Stanford University" in issues[0].details
+        assert "Mellon College" in issues[1].details
+    
+    def test_check_anonymization_comma_separated_emails(self, checker):
+        """Test that each address in a comma-separated author email line is reported."""
+        text = """
+        Anonymous Authors
+        first@uni.edu,second@lab.org,third@gmail.com
+        """
+        
+        issues = checker._check_anonymization(text)
+        found = _found_matches(issues)
+        assert found == {"@uni.edu", "@lab.org", "@gmail.com"}
+    
     def test_check_broken_references_with_issues(self, checker):
         """Test broken reference detection."""
         text = """
@@ -397,55 +437,60 @@ class TestPDFCheckerUnitMethods:
         
         issues = checker._check_ethical_considerations(text)
         assert len(issues) == 0
+    
+    def test_analyze_extracted_page_texts(self, checker):
+        """Test the checks on page texts given directly, without opening a PDF."""
+        body = "This paragraph describes the method in enough words to count as text.\n" * 20
+        page_texts = [
+            "A Paper Title\nAbstract\n" + body,
+            body,
+            body,
+            body + "Limitations\nOur method only handles English.\n",
+            "References\n[1] A. Author. A paper. 2020.\n[2] B. Author. Another paper. 2021.\n",
+        ]
+        
+        result = checker._analyze("paper.pdf", page_texts, PaperType.SHORT)
+        
+        assert result.file_path == "paper.pdf"
+        assert result.total_pages == 5
+        assert result.content_pages == 4  # The references page is not counted
+        assert [(issue.issue_type, issue.severity) for issue in result.issues] == [
+            (IssueType.PAGE_LIMIT, "info")
+        ]
+    
+    def test_skipped_checks_are_not_run(self):
+        """Test that only the enabled checks contribute issues."""
+        checker = PDFChecker(checks=[IssueType.BROKEN_REFERENCES])
+        page = "Contact me at someone@example.com. As shown in ??, it works.\nEthics\n"
+        
+        with patch.object(PDFChecker, "_extract_page_texts", return_value=[page] * 10):
+            result = checker.check_pdf("paper.pdf", PaperType.SHORT)
+        
+        assert [issue.issue_type for issue in result.issues] == [IssueType.BROKEN_REFERENCES] * 10
 
 
 class TestPDFCheckResult:
     """Test PDFCheckResult class functionality."""
     
-    def test_has_errors_property(self):
-        """Test the has_errors property."""
+    @pytest.mark.parametrize("severities, has_errors, has_warnings", [
+        (("error", "warning"), True, True),
+        (("warning", "warning"), False, True),
+        (("error",), True, False),
+        (("info",), False, False),
+        ((), False, False),
+    ])
+    def test_has_errors_and_warnings(self, severities, has_errors, has_warnings):
+        """Test the has_errors and has_warnings properties for each mix of severities."""
         result = PDFCheckResult(
             file_path="test.pdf",
             paper_type=PaperType.SHORT,
             total_pages=5,
             content_pages=5,
-            issues=[
-                Issue(IssueType.PAGE_LIMIT, "error", "Too many pages"),
-                Issue(IssueType.ANONYMIZATION, "warning", "Potential issue")
-            ]
-        )
-        
-        assert result.has_errors is True
-        assert result.has_warnings is True
-    
-    def test_has_warnings_only(self):
-        """Test when there are only warnings."""
-        result = PDFCheckResult(
-            file_path="test.pdf",
-            paper_type=PaperType.SHORT,
-            total_pages=3,
-            content_pages=3,
-            issues=[
-                Issue(IssueType.BROKEN_REFERENCES, "warning", "Broken ref"),
-                Issue(IssueType.ETHICAL_CONSIDERATIONS, "warning", "Ethics found")
-            ]
-        )
-        
-        assert result.has_errors is False
-        assert result.has_warnings is True
-    
-    def test_no_issues(self):
-        """Test when there are no issues."""
-        result = PDFCheckResult(
-            file_path="test.pdf",
-            paper_type=PaperType.SHORT,
-            total_pages=3,
-            content_pages=3,
-            issues=[]
+            issues=[Issue(IssueType.PAGE_LIMIT, severity, "Issue") for severity in severities]
         )
         
-        assert result.has_errors is False
-        assert result.has_warnings is False
+        assert result.has_errors is has_errors
+        assert result.has_warnings is has_warnings
     
     def test_issue_codes_property(self):
         """Test the issue_codes property for generating short codes."""
@@ -465,6 +510,119 @@ class TestPDFCheckResult:
         assert len(result.issues) == 3
         assert result.has_errors is True
         assert result.has_warnings is True
+    
+    def test_to_dict_round_trip(self):
+        """Test that from_dict(to_dict()) rebuilds an equal result with enums restored."""
+        result = PDFCheckResult(
+            file_path="test.pdf",
+            paper_type=PaperType.SHORT,
+            total_pages=6,
+            content_pages=5,
+            issues=[
+                Issue(IssueType.PAGE_LIMIT, "error", "Too long", "Found 5 content pages"),
+                Issue(IssueType.ANONYMIZATION, "warning", "Email found"),
+            ]
+        )
+        
+        data = result.to_dict()
+        
+        assert data["paper_type"] == "short"
+        assert data["issues"][0]["issue_type"] == "page_limit"
+        assert PDFCheckResult.from_dict(data) == result
+
+
+class TestPDFCheckerCache:
+    """Test that check results are reused for files with unchanged content."""
+    
+    RESULT = PDFCheckResult(
+        file_path="placeholder.pdf",
+        paper_type=PaperType.LONG,
+        total_pages=10,
+        content_pages=8,
+        issues=[Issue(IssueType.BROKEN_REFERENCES, "warning", "Broken reference detected", "'??'")]
+    )
+    
+    @pytest.fixture
+    def checker(self, tmp_path):
+        """Create a PDFChecker with a cache in a temporary directory."""
+        return PDFChecker(cache=ResultCache(tmp_path / "cache"))
+    
+    def _fake_checks(self, file_path, paper_type):
+        return PDFCheckResult.from_dict({**self.RESULT.to_dict(), "file_path": file_path})
+    
+    def test_unchanged_file_is_not_rechecked(self, checker, tmp_path):
+        """Test that a second check of the same content comes from the cache."""
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 paper")
+        
+        with patch.object(PDFChecker, "_run_checks", side_effect=self._fake_checks) as run_checks:
+            first = checker.check_pdf(str(pdf_path), PaperType.LONG)
+            second = checker.check_pdf(str(pdf_path), PaperType.LONG)
+        
+        assert run_checks.call_count == 1
+        assert first == second
+    
+    def test_cache_hit_reports_current_path(self, checker, tmp_path):
+        """Test that a renamed copy reuses the cached result under its own path."""
+        original = tmp_path / "paper.pdf"
+        copy = tmp_path / "renamed.pdf"
+        original.write_bytes(b"%PDF-1.4 paper")
+        copy.write_bytes(b"%PDF-1.4 paper")
+        
+        with patch.object(PDFChecker, "_run_checks", side_effect=self._fake_checks) as run_checks:
+            checker.check_pdf(str(original), PaperType.LONG)
+            result = checker.check_pdf(str(copy), PaperType.LONG)
+        
+        assert run_checks.call_count == 1
+        assert result.file_path == str(copy)
+    
+    def test_changed_content_or_type_is_rechecked(self, checker, tmp_path):
+        """Test that the cache is keyed on both file content and paper type."""
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 paper")
+        
+        with patch.object(PDFChecker, "_run_checks", side_effect=self._fake_checks) as run_checks:
+            checker.check_pdf(str(pdf_path), PaperType.LONG)
+            checker.check_pdf(str(pdf_path), PaperType.SHORT)
+            pdf_path.write_bytes(b"%PDF-1.4 revised paper")
+            checker.check_pdf(str(pdf_path), PaperType.LONG)
+        
+        assert run_checks.call_count == 3
+    
+    def test_results_for_other_checks_are_not_reused(self, checker, tmp_path):
+        """Test that the cache is keyed on the set of enabled checks."""
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 paper")
+        partial = PDFChecker(cache=checker.cache, checks=[IssueType.PAGE_LIMIT])
+        
+        with patch.object(PDFChecker, "_run_checks", side_effect=self._fake_checks) as run_checks:
+            checker.check_pdf(str(pdf_path), PaperType.LONG)
+            partial.check_pdf(str(pdf_path), PaperType.LONG)
+            partial.check_pdf(str(pdf_path), PaperType.LONG)
+        
+        assert run_checks.call_count == 2
+    
+    def test_checks_version_bump_invalidates_results(self, checker, tmp_path):
+        """Test that results cached before a CHECKS_VERSION bump are recomputed."""
+        pdf_path = tmp_path / "paper.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 paper")
+        
+        with patch.object(PDFChecker, "_run_checks", side_effect=self._fake_checks) as run_checks:
+            checker.check_pdf(str(pdf_path), PaperType.LONG)
+            with patch("service.pdf_checker.CHECKS_VERSION", -1):
+                checker.check_pdf(str(pdf_path), PaperType.LONG)
+        
+        assert run_checks.call_count == 2
+    
+    def test_unreadable_pdf_is_not_cached(self, checker, tmp_path):
+        """Test that a PDF that fails to parse is retried on the next run."""
+        pdf_path = tmp_path / "broken.pdf"
+        pdf_path.write_bytes(b"not a pdf")
+        
+        first = checker.check_pdf(str(pdf_path), PaperType.LONG)
+        
+        assert first.has_errors
+        assert not list((tmp_path / "cache").glob("*.json"))
 
 
 if __name__ == "__main__":